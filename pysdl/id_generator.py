@@ -1,7 +1,7 @@
 """Unique ID generation for PySDL framework.
 
 This module provides the SdlIdGenerator class for generating unique integer
-identifiers used by signals and processes. IDs are sequential starting from 0
+identifiers used by signals and processes. IDs are sequential starting from 1
 and are unique within a single execution session.
 
 Example:
@@ -15,41 +15,50 @@ Example:
 
 from __future__ import annotations
 
+import itertools
+from typing import ClassVar
+
 
 class SdlIdGenerator:
     """Generator for unique sequential integer IDs.
 
     Provides class methods to generate unique IDs for signals and process
-    classes. IDs are sequential integers starting from 0. Each call to next()
-    increments the counter and returns a new unique ID.
+    classes. IDs are sequential integers starting from 1. Each call to next()
+    advances the counter and returns a new unique ID.
+
+    The counter is an itertools.count, so drawing an ID is a single C-level
+    call that cannot be interleaved under the GIL. id() only reads the last
+    issued ID and never touches the counter.
 
     This class should not be instantiated; use the class methods directly.
 
     Attributes:
-        _id: Internal counter for ID generation (class variable).
+        _counter: Iterator yielding the next IDs to hand out (class variable).
+        _last: Most recently issued ID, or 0 if none (class variable).
     """
 
-    _id: int = 0
+    _counter: ClassVar[itertools.count[int]] = itertools.count(1)
+    _last: ClassVar[int] = 0
 
     @classmethod
     def id(cls) -> int:
         """Get the current ID without incrementing.
 
         Returns:
-            The current ID value.
+            The most recently issued ID, or 0 if none has been issued.
 
         Example:
             >>> current = SdlIdGenerator.id()
             >>> print(current)
             0
         """
-        return cls._id
+        return cls._last
 
     @classmethod
     def next(cls) -> int:
         """Generate and return the next unique ID.
 
-        Increments the internal counter and returns the new value.
+        Advances the internal counter and returns the new value.
         IDs are sequential starting from 1.
 
         Returns:
@@ -60,5 +69,24 @@ class SdlIdGenerator:
             >>> id2 = SdlIdGenerator.next()  # Returns 2
             >>> id3 = SdlIdGenerator.next()  # Returns 3
         """
-        cls._id += 1
-        return cls._id
+        issued = next(cls._counter)
+        cls._last = issued
+        return issued
+
+    @classmethod
+    def reset(cls, start: int = 0) -> None:
+        """Restart the counter so that the next ID is start + 1.
+
+        Intended for test isolation; IDs handed out before the reset may be
+        issued again afterwards.
+
+        Args:
+            start: Value id() reports immediately after the reset.
+
+        Example:
+            >>> SdlIdGenerator.reset()
+            >>> SdlIdGenerator.next()
+            1
+        """
+        cls._counter = itertools.count(start + 1)
+        cls._last = start
@@ -4,8 +4,10 @@ process.py
 
 from __future__ import annotations
 
+import sys
 from collections.abc import Callable, Coroutine
 from time import time
+from types import MethodType
 from typing import Any, TypeVar
 
 from pysdl.exceptions import (
@@ -39,11 +41,33 @@ class SdlProcess:
     Class Attributes:
         _id: Unique ID for this process class (shared across instances).
         _instance_count: Counter for instances of this process class.
+        _share_state_machine: Opt-in flag to build the state machine once per
+            class and share it between instances.
+        _shared_fsm: The shared state machine, once the first instance of a
+            sharing class has been registered.
+
+    Note:
+        The framework-managed instance attributes live in __slots__. Subclasses
+        that do not declare __slots__ keep a regular __dict__, so they can add
+        their own attributes in __init__ as before.
     """
 
+    __slots__ = (
+        "_FSM",
+        "_config_data",
+        "_instance",
+        "_parent",
+        "_pid",
+        "_save_signals",
+        "_state",
+        "_system",
+    )
+
     # Class variables (shared across all instances of this process type)
     _id: int | None = None
     _instance_count: int = 0
+    _share_state_machine: bool = False
+    _shared_fsm: SdlStateMachine | None = None
 
     @classmethod
     async def create(
@@ -51,6 +75,8 @@ class SdlProcess:
         parent_pid: str | None,
         config_data: Any | None = None,
         system: SdlSystem | None = None,
+        *,
+        start_signal: bool = True,
     ) -> T:
         """Create and register a process with a system.
 
@@ -58,6 +84,9 @@ class SdlProcess:
             parent_pid: Parent process ID (or None for root)
             config_data: Optional configuration data
             system: SdlSystem instance to register with (required)
+            start_signal: Send SdlStartSignal to the new process. Pass False
+                to register it quietly, e.g. in tests that would otherwise
+                drain the start signal straight away.
 
         Returns:
             The created and registered process instance
@@ -71,7 +100,7 @@ class SdlProcess:
             )
 
         process = cls(parent_pid, config_data, system=system)
-        await process._register()
+        await process._register(start_signal)
         return process
 
     def __init__(
@@ -115,7 +144,8 @@ class SdlProcess:
             self.__class__.incr_instance()
 
         self._instance: int = self._instance_count
-        self._pid: str = f"{self.name()}({self.id()}.{self.instance()})"
+        # Interned so proc_map and timer_map lookups hit the identity fast path
+        self._pid: str = sys.intern(f"{self.name()}({self.id()}.{self.instance()})")
         self._FSM: SdlStateMachine = SdlStateMachine()
         self._state: SdlState = start
         self._save_signals: list[SdlSignal] = []
@@ -187,7 +217,7 @@ class SdlProcess:
                     await self.output(signal, signal.dst())  # type: ignore
                 except Exception as e:
                     SdlLogger.warning(
-                        f"Failed to send saved signal {signal} in {self.pid()}: {e}"
+                        f"Failed to send saved signal {signal} in {self._pid}: {e}"
                     )
 
     async def output(self, signal: SdlSignal, dst: str) -> bool:
@@ -210,7 +240,7 @@ class SdlProcess:
             raise ValidationError("dst", f"Invalid destination PID: {dst}")
 
         signal.set_dst(dst)
-        signal.set_src(self.pid())
+        signal.set_src(self._pid)
         return await self._system.output(signal)
 
     def start_timer(self, timer: SdlTimer, msec: int) -> None:
@@ -230,8 +260,8 @@ class SdlProcess:
         if msec < 0:
             raise TimerError(str(timer), f"Timer duration cannot be negative: {msec}ms")
 
-        timer.set_dst(self.pid())
-        timer.set_src(self.pid())
+        timer.set_dst(self._pid)
+        timer.set_src(self._pid)
         abs_msec = int(round(time() * 1000)) + msec
         timer.start(abs_msec)
         self._system.startTimer(timer)
@@ -253,8 +283,8 @@ class SdlProcess:
         if sec <= 0:
             raise TimerError(str(timer), f"Timer absolute time must be positive: {sec}")
 
-        timer.set_dst(self.pid())
-        timer.set_src(self.pid())
+        timer.set_dst(self._pid)
+        timer.set_src(self._pid)
         timer.start(sec)
         self._system.startTimer(timer)
 
@@ -270,8 +300,8 @@ class SdlProcess:
         if not isinstance(timer, SdlTimer):
             raise ValidationError("timer", "timer must be an instance of SdlTimer")
 
-        timer.set_dst(self.pid())
-        timer.set_src(self.pid())
+        timer.set_dst(self._pid)
+        timer.set_src(self._pid)
 
         try:
             if not self._system.stopTimer(timer):
@@ -280,19 +310,27 @@ class SdlProcess:
             SdlLogger.warning(f"Error stopping timer {timer}: {e}")
 
     async def stop(self) -> None:
-        await self.output(SdlStoppingSignal.create(), self.pid())
+        await self.output(SdlStoppingSignal.create(), self._pid)
 
     def stop_process(self) -> None:
-        SdlLogger.event("Stopped", self, self.pid(), self.pid())
+        SdlLogger.event("Stopped", self, self._pid, self._pid)
         self._system.unregister(self)
 
     # methods for derived classes to invoke
-    async def _register(self) -> None:
-        self._init_state_machine()
+    async def _register(self, start_signal: bool = True) -> None:
+        cls = type(self)
+        shared = cls.__dict__.get("_shared_fsm")
+        if shared is not None:
+            self._FSM = shared
+        else:
+            self._init_state_machine()
+            if self._share_state_machine:
+                cls._shared_fsm = self._FSM
         self._system.register(self)
         SdlLogger.create(self, self._parent)
         SdlLogger.state(self, "none", self._state)  # type: ignore
-        await self.output(SdlStartSignal.create(), self.pid())
+        if start_signal:
+            await self.output(SdlStartSignal.create(), self._pid)
 
     def _event(
         self,
@@ -300,7 +338,19 @@ class SdlProcess:
         _signal: type[SdlSignal],
         _handler: Callable[..., Coroutine[Any, Any, None]],
     ) -> SdlProcess:
-        """add (state, id, handler) tuple to the state machine"""
+        """add (state, id, handler) tuple to the state machine
+
+        When the class shares its state machine, the handler must be a method
+        of this process; it is stored unbound and rebound on each lookup.
+        """
+        if self._share_state_machine:
+            if getattr(_handler, "__self__", None) is not self:
+                raise ValidationError(
+                    "handler",
+                    "Shared state machines require handlers that are methods "
+                    "of the process",
+                )
+            _handler = _handler.__func__  # type: ignore
         self._FSM.state(_state).event(_signal).handler(_handler)
         return self
 
@@ -336,12 +386,14 @@ class SdlProcess:
         if signal is None:
             raise ValidationError("signal", "Cannot lookup transition for None signal")
 
-        found = self._FSM.find(self.current_state(), signal.id())
+        found = self._FSM.lookup(self._state, signal.id())
         if found is None:
             SdlLogger.warning(
                 f"No handler for signal {signal.id()} ({signal.name()}) "
-                f"in state {self.current_state()} for process {self.pid()}"
+                f"in state {self._state} for process {self._pid}"
             )
+        elif self._share_state_machine:
+            found = MethodType(found, self)
 
         return found
 
@@ -377,6 +429,8 @@ class SdlSingletonProcess(SdlProcess):
         _singleton_instance: The singleton instance of this process class.
     """
 
+    __slots__ = ()
+
     # Class variable for singleton instance (use single underscore for consistency)
     _singleton_instance: SdlSingletonProcess | None = None
 
@@ -386,6 +440,8 @@ class SdlSingletonProcess(SdlProcess):
         parent_pid: str | None,
         config_data: Any | None = None,
         system: SdlSystem | None = None,
+        *,
+        start_signal: bool = True,
     ) -> S:
         """Create and register a singleton process with a system.
 
@@ -393,6 +449,8 @@ class SdlSingletonProcess(SdlProcess):
             parent_pid: Parent process ID (or None for root)
             config_data: Optional configuration data
             system: SdlSystem instance to register with (required)
+            start_signal: Send SdlStartSignal to the process when it is
+                first created
 
         Returns:
             The singleton process instance (created on first call, returned on subsequent calls)
@@ -406,7 +464,7 @@ class SdlSingletonProcess(SdlProcess):
                     "system", "Singleton process creation requires a system instance"
                 )
             cls._singleton_instance = cls(parent_pid, config_data, system=system)
-            await cls._singleton_instance._register()
+            await cls._singleton_instance._register(start_signal)
         return cls._singleton_instance  # type: ignore
 
     def _init_state_machine(self) -> None:
@@ -2,12 +2,18 @@
 
 from __future__ import annotations
 
-from typing import Any, TypeVar
+import weakref
+from typing import Any, ClassVar, TypeVar, cast
 
 from pysdl.id_generator import SdlIdGenerator
 
 T = TypeVar("T", bound="SdlSignal")
 
+# Every live SdlSignal subclass, in definition order, so class IDs can be
+# reassigned in one call without changing their relative order. Each entry
+# removes itself when its class is garbage collected.
+_signal_classes: list[weakref.ref[type[SdlSignal]]] = []
+
 
 class SdlSignal:
     """Base SDL signal class.
@@ -20,14 +26,39 @@ class SdlSignal:
 
     Class Attributes:
         _id: Unique ID for this signal class (shared across instances).
+        _class_name: Default signal name, stamped when the class is defined.
+        _poolable: Opt-in flag to recycle instances after dispatch.
+        _pool: Free list of recycled instances for this signal class.
+        _pool_max: Upper bound on the size of each class's free list.
 
     Note:
         The 'data' attribute provides direct access to _data for backward
         compatibility. New code should prefer property-based access patterns.
+
+        Instance attributes live in __slots__. Subclasses that do not declare
+        their own __slots__ get a regular instance __dict__ as usual.
     """
 
-    # Class variable (shared across all instances of this signal type)
-    _id: int | None = None
+    __slots__ = ("_data", "_dst", "_name", "_pooled", "_src")
+
+    # Class variables (shared across all instances of this signal type)
+    _id: int = SdlIdGenerator.next()
+    _class_name: str = "SdlSignal"
+    _poolable: ClassVar[bool] = False
+    _pool: ClassVar[list[SdlSignal]] = []
+    _pool_max: ClassVar[int] = 64
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """Assign the class ID and name when a signal subclass is defined.
+
+        Stamping the ID at class creation keeps id() a plain attribute read
+        on the dispatch path instead of a lazy first-use branch.
+        """
+        super().__init_subclass__(**kwargs)
+        cls._id = SdlIdGenerator.next()
+        cls._class_name = cls.__name__
+        cls._pool = []
+        _signal_classes.append(weakref.ref(cls, _signal_classes.remove))
 
     @classmethod
     def id(cls) -> int:
@@ -37,13 +68,34 @@ class SdlSignal:
             The unique integer ID for this signal class.
 
         Note:
-            The ID is assigned lazily on first access and cached for all
-            instances of this signal class.
+            Every signal class receives its ID when it is defined, so this
+            is a plain class attribute read.
         """
-        if cls._id is None:
-            cls._id = SdlIdGenerator.next()
         return cls._id
 
+    @staticmethod
+    def _reset_all_ids() -> None:
+        """Reassign the class ID of SdlSignal and every subclass.
+
+        Used after SdlIdGenerator.reset() to isolate tests: every existing
+        signal class draws a fresh ID from the generator, so no stale ID can
+        collide with one issued to a class defined afterwards. Classes are
+        renumbered in definition order, so ID comparisons between them (as
+        used by SdlTimer ordering) give the same answer as before the reset.
+
+        Note:
+            State machines index their handlers by signal class ID and are
+            not rebuilt. A state machine compiled before the reset, including
+            a process class's cached _shared_fsm, keeps the old IDs and must
+            not be used afterwards.
+        """
+        SdlSignal._id = SdlIdGenerator.next()
+        # Iterate over a copy: a collection mid-loop removes entries
+        for ref in list(_signal_classes):
+            cls = ref()
+            if cls is not None:
+                cls._id = SdlIdGenerator.next()
+
     @classmethod
     def create(cls: type[T], _data: Any | None = None) -> T:
         """Create a new signal instance.
@@ -52,16 +104,21 @@ class SdlSignal:
             _data: Optional data payload for the signal.
 
         Returns:
-            A new signal instance with the class ID assigned.
+            A new signal instance. The ID is shared through the class. For
+            classes with _poolable set, a recycled instance is reused when
+            one is available.
 
         Example:
             >>> signal = SdlSignal.create({"key": "value"})
             >>> print(signal.data)
             {'key': 'value'}
         """
-        signal = cls(_data)
-        signal._id = signal.id()
-        return signal
+        if cls._pool:
+            # Re-running __init__ gives the recycled signal a fresh state
+            signal = cast("T", cls._pool.pop())
+            signal.__init__(_data)  # type: ignore
+            return signal
+        return cls(_data)
 
     def __init__(self, _data: Any | None = None) -> None:
         """Initialize a signal instance.
@@ -75,11 +132,30 @@ class SdlSignal:
             - _src: Source process ID (set when sending)
             - _dst: Destination process ID (set when sending)
             - _data: Data payload
+            - _pooled: Whether the signal is sitting in its class pool
         """
-        self._name: str = self.__class__.__name__
+        self._name: str = self._class_name
         self._src: str | None = None
         self._dst: str | None = None
         self._data: Any | None = _data
+        self._pooled: bool = False
+
+    def release(self) -> None:
+        """Return this signal to its class pool once it has been dispatched.
+
+        Does nothing unless the signal class sets _poolable to True. Only set
+        it for signals whose handlers never keep a reference to the signal
+        (for example by saving it or storing it in a list), since the same
+        instance will be handed out again by create().
+
+        Releasing a signal that is already in the pool does nothing, so a
+        signal a handler forwarded is only pooled once even though each of
+        its dispatches releases it.
+        """
+        cls = type(self)
+        if cls._poolable and not self._pooled and len(cls._pool) < cls._pool_max:
+            self._pooled = True
+            cls._pool.append(self)
 
     @property
     def data(self) -> Any | None:
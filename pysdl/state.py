@@ -17,6 +17,8 @@ class SdlState:
         _name: Internal state identifier.
     """
 
+    __slots__ = ("_name",)
+
     _name: str
 
     def __init__(self, name: str) -> None:
@@ -33,7 +35,7 @@ class SdlState:
         Returns:
             The state name.
         """
-        return f"{self.name()}"
+        return self._name
 
     def __format__(self, formatspec: str) -> str:
         """Format the state name.
@@ -44,7 +46,7 @@ class SdlState:
         Returns:
             Formatted state name.
         """
-        return format(str(self.name()), formatspec)
+        return format(self._name, formatspec)
 
     def id(self) -> str:
         """Get the state identifier.
@@ -25,16 +25,44 @@ class SdlStateMachine:
     Attributes:
         _state: Current state being configured (builder pattern).
         _event: Current event ID being configured (builder pattern).
-        _states: Registry of all defined states.
-        _events: Registry of all defined event IDs.
-        _handlers: Nested mapping from (state, event_id) to handler functions.
+        _states: Registry of all defined states, mapped to their row index.
+        _events: Registry of all defined event IDs, mapped to their column index.
+        _handlers: Mapping from (state, event_id) pairs to handler functions.
+        _table: Precomputed handler grid flattened into one tuple indexed as
+            state_index * _n_events + event_index, with the priority ladder
+            already resolved, or None until compiled.
+        _n_events: Row width of the compiled table.
+        _star_state_handlers: Priority 2 handlers keyed by event ID.
+        _star_signal_handlers: Priority 3 handlers keyed by state.
+        _double_star: Priority 4 catch-all handler, if any.
+        _has_wildcards: Whether any priority 2-4 handler is registered.
     """
 
+    __slots__ = (
+        "_double_star",
+        "_event",
+        "_events",
+        "_handlers",
+        "_has_wildcards",
+        "_n_events",
+        "_star_signal_handlers",
+        "_star_state_handlers",
+        "_state",
+        "_states",
+        "_table",
+    )
+
     _state: SdlState | None
     _event: int | None
-    _states: dict[SdlState, None]
-    _events: dict[int, None]
-    _handlers: dict[SdlState, dict[int, Callable[..., Coroutine[Any, Any, None]]]]
+    _states: dict[SdlState, int]
+    _events: dict[int, int]
+    _handlers: dict[tuple[SdlState, int], Callable[..., Coroutine[Any, Any, None]]]
+    _table: tuple[Callable[..., Coroutine[Any, Any, None]] | None, ...] | None
+    _n_events: int
+    _star_state_handlers: dict[int, Callable[..., Coroutine[Any, Any, None]]]
+    _star_signal_handlers: dict[SdlState, Callable[..., Coroutine[Any, Any, None]]]
+    _double_star: Callable[..., Coroutine[Any, Any, None]] | None
+    _has_wildcards: bool
 
     def __init__(self) -> None:
         self._state = None
@@ -42,6 +70,12 @@ class SdlStateMachine:
         self._states = {}
         self._events = {}
         self._handlers = {}
+        self._table = None
+        self._n_events = 0
+        self._star_state_handlers = {}
+        self._star_signal_handlers = {}
+        self._double_star = None
+        self._has_wildcards = False
 
     def state(self, state: SdlState) -> SdlStateMachine:
         """Set the current state for defining transitions.
@@ -64,7 +98,9 @@ class SdlStateMachine:
             )
 
         self._state = state
-        self._states[state] = None
+        if state not in self._states:
+            self._states[state] = len(self._states)
+            self._table = None
         return self
 
     def event(self, event: type[SdlSignal]) -> SdlStateMachine:
@@ -93,7 +129,9 @@ class SdlStateMachine:
             ) from exc
 
         self._event = event.id()
-        self._events[self._event] = None
+        if self._event not in self._events:
+            self._events[self._event] = len(self._events)
+            self._table = None
         return self
 
     def handler(
@@ -122,23 +160,64 @@ class SdlStateMachine:
         if self._event is None:
             raise ValidationError("event", "Event must be set before adding handler")
 
-        if self._state not in self._handlers:
-            self._handlers[self._state] = {}
-
-        self._handlers[self._state][self._event] = handle
+        self._handlers[(self._state, self._event)] = handle
+        self._table = None
         return self
 
     def done(self) -> bool:
         """Complete state machine definition.
 
         Signals that all states, events, and handlers have been defined.
-        This is part of the builder pattern API.
+        This is part of the builder pattern API. The transition table is
+        compiled here so that the first dispatch does not pay for it.
 
         Returns:
             True to indicate successful completion.
         """
+        self._compile()
         return True
 
+    def _compile(
+        self,
+    ) -> tuple[Callable[..., Coroutine[Any, Any, None]] | None, ...]:
+        """Precompute the transition table with wildcard priorities resolved.
+
+        Every (state, event) cell of the registered states x registered events
+        grid is resolved once using the 4-level priority ladder. The rows are
+        laid out back to back in a single immutable tuple, so a lookup inside
+        the grid is one index computation and one subscript. The wildcard
+        handlers are kept separately for states and events outside the grid.
+
+        Returns:
+            The compiled transition table.
+        """
+        star_id = SdlStarSignal.id()
+
+        self._star_state_handlers = {
+            event: handle
+            for (state, event), handle in self._handlers.items()
+            if state is star
+        }
+        self._star_signal_handlers = {
+            state: handle
+            for (state, event), handle in self._handlers.items()
+            if event == star_id
+        }
+        self._double_star = self._handlers.get((star, star_id))
+        self._has_wildcards = bool(
+            self._star_state_handlers or self._star_signal_handlers
+        )
+
+        table = tuple(
+            self._match(state, event, star_id)
+            for state in self._states
+            for event in self._events
+        )
+
+        self._table = table
+        self._n_events = len(self._events)
+        return table
+
     def find(
         self, state: SdlState, event: int
     ) -> Callable[..., Coroutine[Any, Any, None]] | None:
@@ -166,29 +245,62 @@ class SdlStateMachine:
         if event is None:
             raise ValidationError("event", "Cannot find handler for None event")
 
-        # Priority 1: Exact match (state, event)
-        if state in self._handlers:
-            states = self._handlers[state]
-            if event in states:
-                return states[event]
+        return self.lookup(state, event)
 
-        # Priority 2: Star state (star, event) - specific signal, any state
-        if star in self._handlers:
-            star_handlers = self._handlers[star]
-            if event in star_handlers:
-                return star_handlers[event]
+    def lookup(
+        self, state: SdlState, event: int
+    ) -> Callable[..., Coroutine[Any, Any, None]] | None:
+        """Find a handler like find(), without validating the arguments.
 
-        # Priority 3: Star signal (state, SdlStarSignal) - any signal, specific state
-        star_id = SdlStarSignal.id()
-        if state in self._handlers:
-            states = self._handlers[state]
-            if star_id in states:
-                return states[star_id]
-
-        # Priority 4: Double star (star, SdlStarSignal) - catch-all
-        if star in self._handlers:
-            star_handlers = self._handlers[star]
-            if star_id in star_handlers:
-                return star_handlers[star_id]
-
-        return None
+        For callers on the dispatch path that already guarantee a valid state
+        and event ID, such as SdlProcess.lookup_transition().
+
+        Args:
+            state: The state to lookup
+            event: The event ID to lookup
+
+        Returns:
+            The handler function if found, None otherwise
+        """
+        table = self._table
+        if table is None:
+            table = self._compile()
+
+        state_index = self._states.get(state)
+        event_index = self._events.get(event)
+        if state_index is not None and event_index is not None:
+            return table[state_index * self._n_events + event_index]
+
+        # Outside the compiled grid only the wildcard levels can match
+        if not self._has_wildcards:
+            return None
+        return (
+            self._star_state_handlers.get(event)
+            or self._star_signal_handlers.get(state)
+            or self._double_star
+        )
+
+    def _match(
+        self, state: SdlState, event: int, star_id: int
+    ) -> Callable[..., Coroutine[Any, Any, None]] | None:
+        """Resolve a handler by walking the 4-level priority ladder.
+
+        Args:
+            state: The state to lookup
+            event: The event ID to lookup
+            star_id: The ID of SdlStarSignal
+
+        Returns:
+            The handler function if found, None otherwise
+        """
+        handlers = self._handlers
+        return (
+            # Priority 1: Exact match (state, event)
+            handlers.get((state, event))
+            # Priority 2: Star state (star, event) - specific signal, any state
+            or handlers.get((star, event))
+            # Priority 3: Star signal (state, SdlStarSignal) - any signal, specific state
+            or handlers.get((state, star_id))
+            # Priority 4: Double star (star, SdlStarSignal) - catch-all
+            or handlers.get((star, star_id))
+        )
@@ -8,8 +8,11 @@ scheduling, and the main event loop.
 from __future__ import annotations
 
 import asyncio
+import collections
+import heapq
+import itertools
 from time import time
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from .exceptions import (
     QueueError,
@@ -19,11 +22,292 @@ from .exceptions import (
 )
 from .logger import SdlLogger
 from .system_signals import SdlProcessNotExistSignal
+from .timer import SdlTimer
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator
+
     from pysdl.process import SdlProcess
     from pysdl.signal import SdlSignal
-    from pysdl.timer import SdlTimer
+
+
+class _SignalQueue:
+    """FIFO signal queue for the single consumer in SdlSystem.
+
+    Signals are held in a collections.deque. Only a get() on an empty queue
+    allocates anything: it parks on one future that the next put resolves.
+    With a single consumer there is no need for the getter/putter future
+    lists of asyncio.Queue. The interface mirrors the asyncio.Queue subset
+    the system uses.
+    """
+
+    __slots__ = ("_items", "_waiter")
+
+    def __init__(self) -> None:
+        self._items: collections.deque[SdlSignal] = collections.deque()
+        self._waiter: asyncio.Future[None] | None = None
+
+    async def put(self, signal: SdlSignal) -> None:
+        """Append a signal to the queue."""
+        self.put_nowait(signal)
+
+    def put_nowait(self, signal: SdlSignal) -> None:
+        """Append a signal to the queue without awaiting."""
+        self._items.append(signal)
+        waiter = self._waiter
+        if waiter is not None and not waiter.done():
+            waiter.set_result(None)
+
+    async def get(self) -> SdlSignal:
+        """Remove and return the oldest signal, waiting until one is queued."""
+        while not self._items:
+            waiter = asyncio.get_running_loop().create_future()
+            self._waiter = waiter
+            try:
+                await waiter
+            finally:
+                self._waiter = None
+        return self._items.popleft()
+
+    def get_nowait(self) -> SdlSignal:
+        """Remove and return the oldest signal.
+
+        Raises:
+            asyncio.QueueEmpty: If no signal is queued.
+        """
+        if not self._items:
+            raise asyncio.QueueEmpty
+        return self._items.popleft()
+
+    def unget(self, signals: list[SdlSignal]) -> None:
+        """Put signals back at the front of the queue, keeping their order."""
+        if not signals:
+            return
+        self._items.extendleft(reversed(signals))
+        waiter = self._waiter
+        if waiter is not None and not waiter.done():
+            waiter.set_result(None)
+
+    def empty(self) -> bool:
+        """Return True if no signal is queued."""
+        return not self._items
+
+    def clear(self) -> None:
+        """Drop every queued signal."""
+        self._items.clear()
+
+    def qsize(self) -> int:
+        """Return the number of queued signals."""
+        return len(self._items)
+
+
+class _ReadyList:
+    """Processes with pending signals, stored as per-process entry counts.
+
+    Supports the list operations the system and its callers use (append,
+    remove, count, membership, len, clear) and keeps one entry per delivered
+    signal, but membership and removing every entry of a process are O(1)
+    instead of list scans.
+
+    Iteration order differs from a list: all entries of a process are
+    yielded together, at the position of that process's first entry, so
+    appending A, B, A iterates as A, A, B. A process whose entries were all
+    removed moves to the end when it is appended again.
+    """
+
+    __slots__ = ("_counts", "_size")
+
+    def __init__(self) -> None:
+        self._counts: dict[SdlProcess, int] = {}
+        self._size = 0
+
+    def append(self, process: SdlProcess) -> None:
+        """Add one entry for a process."""
+        self._counts[process] = self._counts.get(process, 0) + 1
+        self._size += 1
+
+    def remove(self, process: SdlProcess) -> None:
+        """Remove one entry for a process.
+
+        Raises:
+            ValueError: If the process has no entry.
+        """
+        count = self._counts.get(process)
+        if count is None:
+            raise ValueError(f"{process} is not in the ready list")
+        if count == 1:
+            del self._counts[process]
+        else:
+            self._counts[process] = count - 1
+        self._size -= 1
+
+    def discard(self, process: SdlProcess) -> int:
+        """Remove every entry for a process.
+
+        Returns:
+            The number of entries removed.
+        """
+        count = self._counts.pop(process, 0)
+        self._size -= count
+        return count
+
+    def count(self, process: SdlProcess) -> int:
+        """Return the number of entries for a process."""
+        return self._counts.get(process, 0)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        self._counts.clear()
+        self._size = 0
+
+    def __contains__(self, process: object) -> bool:
+        return process in self._counts
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __iter__(self) -> Iterator[SdlProcess]:
+        for process, count in self._counts.items():
+            for _ in range(count):
+                yield process
+
+    def __repr__(self) -> str:
+        return f"_ReadyList({self._counts!r})"
+
+
+class _TimerBucket:
+    """Active timers of one process, keyed by (timer ID, appcorr).
+
+    Timers compare equal when their ID and application correlator match, so
+    that pair is the key: starting an equal timer replaces the running one
+    and stopping or checking membership is a dict operation rather than a
+    list scan. Iteration yields timers in the order they were started.
+
+    The appcorr of a running timer can still be changed, so the key each
+    timer was stored under is remembered by identity. A timer object that is
+    in the bucket is always found and removed under that key, whatever its
+    current appcorr.
+    """
+
+    __slots__ = ("_keys", "_timers")
+
+    def __init__(self) -> None:
+        self._timers: dict[tuple[int, int], SdlTimer] = {}
+        self._keys: dict[int, tuple[int, int]] = {}
+
+    def _pop_key(self, key: tuple[int, int]) -> SdlTimer | None:
+        timer = self._timers.pop(key, None)
+        if timer is not None:
+            del self._keys[id(timer)]
+        return timer
+
+    def add(self, timer: SdlTimer) -> None:
+        """Add a timer, replacing an equal one that is already running."""
+        stored_key = self._keys.get(id(timer))
+        if stored_key is not None:
+            # Restarting the same object, possibly with a new appcorr
+            self._pop_key(stored_key)
+        key = (timer.id(), timer.appcorr())
+        self._pop_key(key)
+        self._timers[key] = timer
+        self._keys[id(timer)] = key
+
+    def discard(self, timer: SdlTimer) -> bool:
+        """Remove the given timer, or a running timer equal to it.
+
+        Returns:
+            True if a timer was removed, False if none was running.
+        """
+        key = self._keys.get(id(timer), (timer.id(), timer.appcorr()))
+        return self._pop_key(key) is not None
+
+    def get(self, timer: SdlTimer) -> SdlTimer | None:
+        """Return the given timer if it is running, else an equal running one."""
+        if id(timer) in self._keys:
+            return timer
+        return self._timers.get((timer.id(), timer.appcorr()))
+
+    def __contains__(self, timer: object) -> bool:
+        if not isinstance(timer, SdlTimer):
+            return False
+        return self.get(timer) is not None
+
+    def __len__(self) -> int:
+        return len(self._timers)
+
+    def __iter__(self) -> Iterator[SdlTimer]:
+        return iter(self._timers.values())
+
+    def __repr__(self) -> str:
+        return f"_TimerBucket([{', '.join(str(timer) for timer in self)}])"
+
+
+class _PidTrie:
+    """Character trie over registered process IDs.
+
+    PIDs have the form ``Name(x.y)``, so every process of one class shares
+    the ``Name(`` prefix. Each node is a dict from character to child node;
+    the process registered under the PID that ends at a node is stored
+    under the None key. A prefix query walks len(prefix) nodes and then
+    collects the subtree instead of scanning every registered PID.
+    """
+
+    __slots__ = ("_root",)
+
+    def __init__(self) -> None:
+        self._root: dict[str | None, Any] = {}
+
+    def insert(self, pid: str, process: SdlProcess) -> None:
+        """Store a process under its PID, replacing any previous entry."""
+        node = self._root
+        for char in pid:
+            node = node.setdefault(char, {})
+        node[None] = process
+
+    def remove(self, pid: str) -> bool:
+        """Remove the entry for a PID and prune branches left empty.
+
+        Returns:
+            True if an entry was removed, False if the PID was not present.
+        """
+        path = []
+        node = self._root
+        for char in pid:
+            child = node.get(char)
+            if child is None:
+                return False
+            path.append((node, char))
+            node = child
+        if node.pop(None, None) is None:
+            return False
+        for parent, char in reversed(path):
+            if parent[char]:
+                break
+            del parent[char]
+        return True
+
+    def with_prefix(self, prefix: str) -> list[SdlProcess]:
+        """Return the processes whose PID starts with the given prefix."""
+        node = self._root
+        for char in prefix:
+            child = node.get(char)
+            if child is None:
+                return []
+            node = child
+        processes = []
+        stack = [node]
+        while stack:
+            node = stack.pop()
+            for key, value in node.items():
+                if key is None:
+                    processes.append(value)
+                else:
+                    stack.append(value)
+        return processes
+
+    def clear(self) -> None:
+        """Remove every entry."""
+        self._root.clear()
 
 
 class SdlSystem:
@@ -33,31 +317,37 @@ class SdlSystem:
 
     Attributes:
         proc_map: Registry mapping process IDs to SdlProcess instances.
-        timer_map: Registry mapping process IDs to lists of active timers.
-        ready_list: Queue of processes ready for signal processing.
-        _queue: Asyncio queue for signal delivery (created lazily).
+        _pid_trie: Prefix index over proc_map for lookup_prefix().
+        timer_map: Registry mapping process IDs to their active timers.
+        _deadlines: Min-heap of (deadline, sequence, timer) entries used by
+            expire(). Entries for stopped or replaced timers are left in
+            place and skipped when popped.
+        ready_list: Processes ready for signal processing, one entry per
+            delivered signal.
+        _queue: Signal queue for signal delivery (created lazily).
         _stop: Flag to stop the event loop.
     """
 
     def __init__(self) -> None:
         """Initialize a new independent SDL system instance."""
         self.proc_map: dict[str, SdlProcess] = {}
-        self.timer_map: dict[str, list[SdlTimer]] = {}
-        self.ready_list: list[SdlProcess] = []
-        self._queue: asyncio.Queue[SdlSignal] | None = None
+        self._pid_trie: _PidTrie = _PidTrie()
+        self.timer_map: dict[str, _TimerBucket] = {}
+        self._deadlines: list[tuple[int, int, SdlTimer]] = []
+        self._deadline_seq = itertools.count()
+        self._compact_at: int = 64
+        self.ready_list: _ReadyList = _ReadyList()
+        self._queue: _SignalQueue | None = None
         self._stop: bool = False
 
-    def _get_queue(self) -> asyncio.Queue[SdlSignal]:
-        """Get or create the asyncio.Queue lazily for this system instance.
-
-        This is needed because asyncio.Queue must be created within
-        a running event loop context.
+    def _get_queue(self) -> _SignalQueue:
+        """Get or create the signal queue lazily for this system instance.
 
         Returns:
             The queue for this system instance.
         """
         if self._queue is None:
-            self._queue = asyncio.Queue()
+            self._queue = _SignalQueue()
         return self._queue
 
     def register(self, process: SdlProcess | None) -> bool:
@@ -81,6 +371,7 @@ class SdlSystem:
 
         if pid not in self.proc_map:
             self.proc_map[pid] = process
+            self._pid_trie.insert(pid, process)
             SdlLogger.event("Registered", process, pid, pid)
             return True
 
@@ -112,23 +403,19 @@ class SdlSystem:
             raise ValidationError("pid", "Process has invalid PID")
 
         # remove from proc_map
-        if pid in self.proc_map:
-            del self.proc_map[pid]
+        if self.proc_map.pop(pid, None) is not None:
+            self._pid_trie.remove(pid)
             SdlLogger.event("Unregistered", process, pid, pid)
         else:
             SdlLogger.warning(f"Process {pid} was not in proc_map during unregister")
 
-        # remove from timer_map
-        if pid in self.timer_map:
-            timer_count = len(self.timer_map[pid])
-            del self.timer_map[pid]
-            SdlLogger.event("TimersCleared", process, pid, f"{timer_count} timers")
+        # remove from timer_map; stale deadline heap entries are skipped later
+        bucket = self.timer_map.pop(pid, None)
+        if bucket is not None:
+            SdlLogger.event("TimersCleared", process, pid, f"{len(bucket)} timers")
 
         # remove from ready_list
-        removed_count = 0
-        while process in self.ready_list:
-            self.ready_list.remove(process)
-            removed_count += 1
+        removed_count = self.ready_list.discard(process)
         if removed_count > 0:
             SdlLogger.event(
                 "ReadyListCleared", process, pid, f"{removed_count} entries"
@@ -172,6 +459,28 @@ class SdlSystem:
 
         return self.proc_map.get(dst)
 
+    def lookup_prefix(self, prefix: str) -> list[SdlProcess]:
+        """Lookup every process whose PID starts with a prefix.
+
+        Uses a trie kept alongside proc_map, so the cost depends on the
+        prefix length and the number of matches rather than on the number
+        of registered processes. A prefix such as ``"MyProcess("`` selects
+        all instances of one process class.
+
+        Args:
+            prefix: The PID prefix to match; an empty prefix matches all
+
+        Returns:
+            The matching processes, in no particular order
+
+        Raises:
+            ValidationError: If prefix is not a string
+        """
+        if not isinstance(prefix, str):
+            raise ValidationError("prefix", f"Invalid PID prefix: {prefix}")
+
+        return self._pid_trie.with_prefix(prefix)
+
     async def output(self, signal: SdlSignal) -> bool:
         """Send a signal to its destination process in this system instance.
 
@@ -196,8 +505,8 @@ class SdlSystem:
         if not dst:
             raise ValidationError("signal.dst", "Signal has no destination")
 
-        if dst in self.proc_map:
-            process = self.proc_map[dst]
+        process = self.proc_map.get(dst)
+        if process is not None:
             self.ready_list.append(process)
             try:
                 await process.input(signal)
@@ -214,7 +523,8 @@ class SdlSystem:
             src = signal.src()
             SdlLogger.warning(f"Signal {signal.name()} to nonexistent process {dst}")
 
-            if src and src in self.proc_map:
+            source_process = self.proc_map.get(src) if src else None
+            if src and source_process is not None:
                 error_signal = SdlProcessNotExistSignal(
                     original_signal=type(signal).__name__, destination=dst, source=src
                 )
@@ -222,7 +532,6 @@ class SdlSystem:
                 error_signal.set_src("SdlSystem")
 
                 try:
-                    source_process = self.proc_map[src]
                     self.ready_list.append(source_process)
                     await source_process.input(error_signal)
                     SdlLogger.signal("SdlProcessNotExist", error_signal, source_process)
@@ -253,17 +562,31 @@ class SdlSystem:
         if not pid:
             raise TimerError(str(timer), "Timer has no source PID")
 
-        # Stop timer if already running to prevent duplicates
-        # Use try-except since stopTimer now raises on None
-        try:
-            self.stopTimer(timer)
-        except ValidationError:
-            # Timer not running, that's fine
-            pass
+        # Adding replaces an equal timer that is already running
+        bucket = self.timer_map.get(pid)
+        if bucket is None:
+            bucket = self.timer_map[pid] = _TimerBucket()
+        bucket.add(timer)
+        self._schedule(timer)
 
-        if pid not in self.timer_map:
-            self.timer_map[pid] = []
-        self.timer_map[pid].append(timer)
+    def _schedule(self, timer: SdlTimer) -> None:
+        """Push a timer onto the deadline heap.
+
+        Stopped and replaced timers leave stale entries behind, so once the
+        heap has doubled in size since it was last rebuilt it is rebuilt
+        from the running timers only.
+        """
+        heapq.heappush(
+            self._deadlines, (timer.deadline(), next(self._deadline_seq), timer)
+        )
+        if len(self._deadlines) > self._compact_at:
+            self._deadlines = [
+                (running.deadline(), next(self._deadline_seq), running)
+                for bucket in self.timer_map.values()
+                for running in bucket
+            ]
+            heapq.heapify(self._deadlines)
+            self._compact_at = max(64, 2 * len(self._deadlines))
 
     def stopTimer(self, timer: SdlTimer | None) -> bool:
         """Stop a timer in this system instance.
@@ -288,17 +611,12 @@ class SdlSystem:
             SdlLogger.warning(f"Timer {timer} has no source PID")
             return False
 
-        if pid not in self.timer_map:
+        bucket = self.timer_map.get(pid)
+        if bucket is None or not bucket.discard(timer):
             return False
 
-        timer_list = self.timer_map[pid]
-        if timer not in timer_list:
-            return False
-
-        timer_list.remove(timer)
-
-        # Clean up empty timer list to prevent memory leaks
-        if not timer_list:
+        # Clean up empty timer bucket to prevent memory leaks
+        if not bucket:
             del self.timer_map[pid]
 
         return True
@@ -318,6 +636,39 @@ class SdlSystem:
             SdlLogger.warning(f"Failed to get next signal from queue: {e}")
             raise QueueError(f"Failed to get signal from queue: {e}") from e
 
+    async def get_next_signals(self, max_n: int = 64) -> list[SdlSignal]:
+        """Get up to max_n queued signals in one call.
+
+        Waits for the first signal like get_next_signal(), then takes any
+        signals that are already queued behind it without awaiting again.
+
+        Args:
+            max_n: Maximum number of signals to return
+
+        Returns:
+            Between one and max_n signals, oldest first
+
+        Raises:
+            ValidationError: If max_n is less than 1
+            QueueError: If queue operation fails
+        """
+        if max_n < 1:
+            raise ValidationError("max_n", f"Batch size must be at least 1: {max_n}")
+
+        queue = self._get_queue()
+        try:
+            signals = [await queue.get()]
+        except Exception as e:
+            SdlLogger.warning(f"Failed to get next signal from queue: {e}")
+            raise QueueError(f"Failed to get signal from queue: {e}") from e
+
+        for _ in range(max_n - 1):
+            try:
+                signals.append(queue.get_nowait())
+            except asyncio.QueueEmpty:
+                break
+        return signals
+
     async def _process_signal(self, signal: SdlSignal) -> None:
         """Process a single signal by finding and executing its handler.
 
@@ -335,6 +686,7 @@ class SdlSystem:
         signal_handler = process.lookup_transition(signal)
         if signal_handler is None:
             SdlLogger.signal("SdlSig-NA", signal, process)
+            self._release(signal)
             return
 
         SdlLogger.signal("SdlSig", signal, process)
@@ -343,6 +695,43 @@ class SdlSystem:
         except Exception as e:
             SdlLogger.warning(f"Error in signal handler for {signal} in {process}: {e}")
             # Continue processing - don't crash the system
+        self._release(signal)
+
+    @staticmethod
+    def _release(signal: SdlSignal) -> None:
+        """Return a dispatched signal to its pool.
+
+        Timers are skipped: a process usually keeps its timer object and
+        restarts it, so recycling it here would hand the same instance to a
+        second owner. A timer created fresh on every start can still be
+        released by its owner.
+
+        Args:
+            signal: The signal that was just dispatched
+        """
+        if not isinstance(signal, SdlTimer):
+            signal.release()
+
+    async def drain_ready(self) -> int:
+        """Process every signal that is already queued without yielding.
+
+        Signals are pulled with get_nowait() and dispatched back to back until
+        the queue is empty, including any signals the handlers enqueue while
+        draining. Unlike run(), this does not check timers or the stop flag,
+        so it suits tests and callers that drive the system step by step.
+
+        Returns:
+            The number of signals processed.
+        """
+        queue = self._get_queue()
+        processed = 0
+        while True:
+            try:
+                signal = queue.get_nowait()
+            except asyncio.QueueEmpty:
+                return processed
+            await self._process_signal(signal)
+            processed += 1
 
     async def run(self) -> bool:
         """Main event loop for this SDL system instance.
@@ -358,29 +747,39 @@ class SdlSystem:
         """
         while True:
             try:
-                # Get next signal with timeout to allow periodic timer checks
-                signal = None
+                # Get queued signals with timeout to allow periodic timer checks
+                signals: list[SdlSignal] = []
                 try:
-                    signal = await asyncio.wait_for(
-                        self.get_next_signal(), timeout=0.01
+                    signals = await asyncio.wait_for(
+                        self.get_next_signals(), timeout=0.01
                     )  # 10ms timeout
                 except asyncio.TimeoutError:
                     # No signal available, continue to timer check
                     pass
 
-                if signal is not None:
+                for index, signal in enumerate(signals):
                     try:
-                        await self._process_signal(signal)
-                    except ValidationError as e:
-                        SdlLogger.warning(f"Validation error processing signal: {e}")
-                    finally:
-                        del signal
+                        try:
+                            await self._process_signal(signal)
+                        except ValidationError as e:
+                            SdlLogger.warning(
+                                f"Validation error processing signal: {e}"
+                            )
 
-                # Check for timer expiries
-                try:
-                    await self.expire(int(round(time() * 1000)))  # current time in ms
-                except Exception as e:
-                    SdlLogger.warning(f"Error processing timer expiration: {e}")
+                        # Check timers after every signal, as for a single get
+                        await self._expire_due()
+                    except BaseException:
+                        # Hand the undispatched rest back so it is not lost
+                        self._get_queue().unget(signals[index + 1 :])
+                        raise
+
+                    if self._stop is True:
+                        # Leave the rest queued, as if it had not been fetched
+                        self._get_queue().unget(signals[index + 1 :])
+                        break
+
+                if not signals:
+                    await self._expire_due()
 
                 # Check for stop of the system
                 if self._stop is True:
@@ -404,15 +803,41 @@ class SdlSystem:
                 # Continue running to avoid complete system failure
                 await asyncio.sleep(0.1)
 
+    async def _expire_due(self) -> None:
+        """Deliver the timers that are due at the current time."""
+        try:
+            await self.expire(int(round(time() * 1000)))  # current time in ms
+        except Exception as e:
+            SdlLogger.warning(f"Error processing timer expiration: {e}")
+
     def stop(self) -> None:
         """Stop this SDL system instance."""
         self._stop = True
 
+    def reset(self) -> None:
+        """Return this system to its freshly constructed state.
+
+        Empties the existing containers in place instead of replacing them,
+        so a system can be reused, for example by a test fixture shared
+        across many tests. Processes and queued signals are dropped without
+        being stopped or delivered.
+        """
+        self.proc_map.clear()
+        self._pid_trie.clear()
+        self.timer_map.clear()
+        self._deadlines.clear()
+        self._compact_at = 64
+        self.ready_list.clear()
+        if self._queue is not None:
+            self._queue.clear()
+        self._stop = False
+
     async def expire(self, msec: int) -> None:
         """Process timer expirations for this system instance.
 
-        Checks all active timers and delivers expired timer signals.
-        Removes expired timers from the timer map.
+        Pops timers from the deadline heap while the earliest deadline is due,
+        delivers each one that is still running and removes it from the timer
+        map. Timers that were not yet due are left untouched.
 
         Args:
             msec: Current time in milliseconds
@@ -420,30 +845,31 @@ class SdlSystem:
         Raises:
             TimerError: If timer processing fails critically
         """
-        expired: list[SdlTimer] = []
+        deadlines = self._deadlines
+        while deadlines and deadlines[0][0] <= msec:
+            _deadline, _seq, timer = heapq.heappop(deadlines)
 
-        # send all expired timers
-        for _pid, timerList in list(self.timer_map.items()):
-            for timer in timerList:
+            # Skip entries left behind by stopped or replaced timers
+            bucket = self.timer_map.get(timer.src())  # type: ignore
+            if bucket is None or bucket.get(timer) is not timer:
+                continue
+
+            try:
+                timer.expire(msec)
+                if not timer.expired():
+                    # Restarted without going through startTimer()
+                    self._schedule(timer)
+                    continue
                 try:
-                    timer.expire(msec)
-                    if timer.expired():
-                        try:
-                            await self.output(timer)
-                            expired.append(timer)
-                        except Exception as e:
-                            SdlLogger.warning(
-                                f"Failed to deliver expired timer {timer}: {e}"
-                            )
-                            # Still mark as expired to remove it
-                            expired.append(timer)
+                    await self.output(timer)
                 except Exception as e:
-                    SdlLogger.warning(
-                        f"Error checking timer expiration for {timer}: {e}"
-                    )
+                    SdlLogger.warning(f"Failed to deliver expired timer {timer}: {e}")
+                    # Still stop it below so it is removed
+            except Exception as e:
+                SdlLogger.warning(f"Error checking timer expiration for {timer}: {e}")
+                # Its heap entry is gone, so stop it rather than leave it stranded
 
-        # stop all expired timers
-        for timer in expired:
+            # stop the expired timer
             try:
                 if not self.stopTimer(timer):
                     SdlLogger.warning(f"Timer {timer} was already stopped")
@@ -60,6 +60,8 @@ class SdlStartSignal(SdlSignal):
         ...     await self.next_state(self.state_idle)
     """
 
+    __slots__ = ()
+
     def __str__(self) -> str:
         base = super().__str__()
         return f"[{base}]"
@@ -84,6 +86,8 @@ class SdlStoppingSignal(SdlSignal):
         ...     self.stop_process()
     """
 
+    __slots__ = ()
+
     def __str__(self) -> str:
         base = super().__str__()
         return f"[{base}]"
@@ -97,6 +101,8 @@ class SdlStopSignal(SdlSignal):
     process termination.
     """
 
+    __slots__ = ()
+
     def __str__(self) -> str:
         base = super().__str__()
         return f"[{base}]"
@@ -129,6 +135,8 @@ class SdlStarSignal(SdlSignal):
                 logger.info(f"Unhandled signal {signal.name()} in state_active")
     """
 
+    __slots__ = ()
+
     def __str__(self) -> str:
         base = super().__str__()
         return f"[{base}]"
@@ -160,6 +168,8 @@ class SdlProcessNotExistSignal(SdlSignal):
         ...     print(f"Process {failed_dest} does not exist")
     """
 
+    __slots__ = ("_error_data",)
+
     _error_data: dict[str, str]
 
     def __init__(
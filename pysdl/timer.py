@@ -6,13 +6,10 @@ Timers inherit from SdlSignal and are delivered to processes when they expire.
 
 from __future__ import annotations
 
-from typing import Any, TypeVar
+from typing import Any
 
-from pysdl.id_generator import SdlIdGenerator
 from pysdl.signal import SdlSignal
 
-T = TypeVar("T", bound="SdlTimer")
-
 
 class SdlTimer(SdlSignal):
     """SDL timer class.
@@ -26,25 +23,17 @@ class SdlTimer(SdlSignal):
         _duration: Timer duration in milliseconds.
         _expiry: Expiry timestamp in milliseconds.
         data: Optional data payload carried by the timer signal.
+
+    Note:
+        Like SdlSignal, instance attributes live in __slots__.
     """
 
-    _id: int | None = None
+    __slots__ = ("_appcorr", "_duration", "_expiry")
+
     _appcorr: int
     _duration: int
     _expiry: int
 
-    @classmethod
-    def id(cls) -> int:
-        if cls._id is None:
-            cls._id = SdlIdGenerator.next()
-        return cls._id
-
-    @classmethod
-    def create(cls: type[T], _data: Any | None = None) -> T:
-        signal = cls(_data)
-        signal._id = signal.id()
-        return signal
-
     def __init__(self, _data: Any | None = None) -> None:
         super().__init__()
         self._appcorr = 0
@@ -111,6 +100,14 @@ class SdlTimer(SdlSignal):
         self._duration = msec
         self._expiry = 0
 
+    def deadline(self) -> int:
+        """Get the time at which the timer expires.
+
+        Returns:
+            The expiry time in milliseconds, as passed to start().
+        """
+        return self._duration
+
     def expired(self) -> bool:
         """Check if the timer has expired.
 
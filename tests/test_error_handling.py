@@ -82,11 +82,9 @@ class TestCustomExceptions:
     def reset_state(self):
         """Reset state before each test."""
         from pysdl.signal import SdlSignal
-        from pysdl.timer import SdlTimer
 
-        SdlIdGenerator._id = 0
-        SdlSignal._id = None
-        SdlTimer._id = None
+        SdlIdGenerator.reset()
+        SdlSignal._reset_all_ids()
 
     @pytest.fixture
     def sdl_system(self):
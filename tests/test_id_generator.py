@@ -17,7 +17,7 @@ class TestSdlIdGenerator:
 
         This ensures tests are isolated and don't depend on execution order.
         """
-        SdlIdGenerator._id = 0
+        SdlIdGenerator.reset()
 
     def test_initial_id_is_zero(self) -> None:
         """Test that the initial ID is 0."""
@@ -49,6 +49,28 @@ class TestSdlIdGenerator:
         assert SdlIdGenerator.id() == 1
         assert SdlIdGenerator.id() == 1
 
+    def test_id_leaves_counter_untouched(self) -> None:
+        """Test that id() does not replace or consume the underlying counter."""
+        SdlIdGenerator.next()
+        counter = SdlIdGenerator._counter
+        SdlIdGenerator.id()
+        assert SdlIdGenerator._counter is counter
+        assert SdlIdGenerator.next() == 2
+
+    def test_reset_restarts_sequence(self) -> None:
+        """Test that reset() makes the next ID start again from 1."""
+        SdlIdGenerator.next()
+        SdlIdGenerator.next()
+        SdlIdGenerator.reset()
+        assert SdlIdGenerator.id() == 0
+        assert SdlIdGenerator.next() == 1
+
+    def test_reset_with_start(self) -> None:
+        """Test that reset(start) continues the sequence after start."""
+        SdlIdGenerator.reset(41)
+        assert SdlIdGenerator.id() == 41
+        assert SdlIdGenerator.next() == 42
+
     def test_instantiation_allowed(self) -> None:
         """Test that the class can be instantiated without errors.
 
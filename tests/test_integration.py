@@ -27,10 +27,9 @@ class TestIntegration:
     @pytest.fixture(autouse=True)
     def reset_system(self) -> None:
         """Reset system state before each test."""
-        SdlIdGenerator._id = 0
-        # Reset Signal and Timer class IDs to prevent cross-test contamination
-        SdlSignal._id = None
-        SdlTimer._id = None
+        SdlIdGenerator.reset()
+        # Reset all signal class IDs to prevent cross-test contamination
+        SdlSignal._reset_all_ids()
 
     @pytest.fixture
     def sdl_system(self) -> SdlSystem:
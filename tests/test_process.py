@@ -24,12 +24,10 @@ class TestSdlProcess:
     def reset_state(self) -> None:
         """Reset state before each test."""
         from pysdl.signal import SdlSignal
-        from pysdl.timer import SdlTimer
 
-        SdlIdGenerator._id = 0
-        # Reset Signal and Timer class IDs to prevent cross-test contamination
-        SdlSignal._id = None
-        SdlTimer._id = None
+        SdlIdGenerator.reset()
+        # Reset all signal class IDs to prevent cross-test contamination
+        SdlSignal._reset_all_ids()
         # Reset process instance counter
         self.TestProcess._instance_count = 0
 
@@ -77,6 +75,17 @@ class TestSdlProcess:
         process = await self.TestProcess.create(None, system=sdl_system)
         assert process is not None
         assert process.pid() in sdl_system.proc_map
+        assert sdl_system._get_queue().qsize() == 1
+
+    @pytest.mark.asyncio
+    async def test_process_create_without_start_signal(self, sdl_system) -> None:
+        """Test that start_signal=False registers without sending a signal."""
+        process = await self.TestProcess.create(
+            None, system=sdl_system, start_signal=False
+        )
+        assert process.pid() in sdl_system.proc_map
+        assert sdl_system._get_queue().empty()
+        assert len(sdl_system.ready_list) == 0
 
     def test_process_pid_format(self, sdl_system) -> None:
         """Test process PID format."""
@@ -166,6 +175,55 @@ class TestSdlProcess:
         process = self.TestProcess(None, system=sdl_system)
         assert repr(process) == process.pid()
 
+    def test_process_subclass_keeps_instance_attributes(self, sdl_system) -> None:
+        """Test that subclasses can still add attributes alongside the slots."""
+        process = self.TestProcess(None, system=sdl_system)
+        process.custom = "value"  # type: ignore[attr-defined]
+        assert process.custom == "value"  # type: ignore[attr-defined]
+        assert "_pid" in SdlProcess.__slots__
+
+    @pytest.mark.asyncio
+    async def test_process_shared_state_machine(self, sdl_system) -> None:
+        """Test that opted-in classes build the state machine only once."""
+
+        class SharedProcess(SdlProcess):
+            _share_state_machine = True
+            init_calls = 0
+
+            def _init_state_machine(self) -> None:
+                type(self).init_calls += 1
+                self._event(start, SdlStartSignal, self.handle_start)
+                self._done()
+
+            async def handle_start(self, signal: SdlSignal) -> None:
+                pass
+
+        p1 = await SharedProcess.create(None, system=sdl_system)
+        p2 = await SharedProcess.create(None, system=sdl_system)
+
+        assert SharedProcess.init_calls == 1
+        assert p1._FSM is p2._FSM
+        handler = p2.lookup_transition(SdlStartSignal.create())
+        assert handler == p2.handle_start
+
+    @pytest.mark.asyncio
+    async def test_process_shared_state_machine_rejects_foreign_handler(
+        self, sdl_system
+    ) -> None:
+        """Test that shared state machines only accept the process's own methods."""
+
+        async def standalone(signal: SdlSignal) -> None:
+            pass
+
+        class SharedProcess(SdlProcess):
+            _share_state_machine = True
+
+            def _init_state_machine(self) -> None:
+                self._event(start, SdlStartSignal, standalone)
+
+        with pytest.raises(ValidationError, match="Shared state machines"):
+            await SharedProcess.create(None, system=sdl_system)
+
     @pytest.mark.asyncio
     async def test_process_output_signal(self, sdl_system) -> None:
         """Test sending signal to another process."""
@@ -524,7 +582,7 @@ class TestSdlSingletonProcess:
     @pytest.fixture(autouse=True)
     def reset_state(self) -> None:
         """Reset state before each test."""
-        SdlIdGenerator._id = 0
+        SdlIdGenerator.reset()
         # Clear singleton instances
         SdlSingletonProcess._singleton_instance = None
 
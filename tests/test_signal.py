@@ -3,10 +3,12 @@
 This module tests signal creation, source/destination handling, and signal routing.
 """
 
+import gc
 from typing import Optional
 
 import pytest
 
+from pysdl import signal as signal_module
 from pysdl.id_generator import SdlIdGenerator
 from pysdl.signal import SdlSignal
 
@@ -17,7 +19,8 @@ class TestSdlSignal:
     @pytest.fixture(autouse=True)
     def reset_state(self) -> None:
         """Reset state before each test."""
-        SdlIdGenerator._id = 0
+        SdlIdGenerator.reset()
+        SdlSignal._reset_all_ids()
 
     def test_signal_creation(self) -> None:
         """Test basic signal creation."""
@@ -25,6 +28,22 @@ class TestSdlSignal:
         assert signal is not None
         assert isinstance(signal, SdlSignal)
 
+    def test_signal_has_no_instance_dict(self) -> None:
+        """Test that base signals keep their fields in slots."""
+        signal = SdlSignal.create({"key": "value"})
+        assert not hasattr(signal, "__dict__")
+        assert signal.data == {"key": "value"}
+
+    def test_signal_subclass_without_slots_accepts_attributes(self) -> None:
+        """Test that user subclasses can still add their own attributes."""
+
+        class PayloadSignal(SdlSignal):
+            pass
+
+        signal = PayloadSignal.create()
+        signal.extra = "value"  # type: ignore[attr-defined]
+        assert signal.extra == "value"  # type: ignore[attr-defined]
+
     def test_signal_id_assignment(self) -> None:
         """Test that signals get unique IDs."""
 
@@ -52,6 +71,99 @@ class TestSdlSignal:
         # Same signal type should have same ID
         assert signal1.id() == signal2.id()
 
+    def test_signal_subclass_id_assigned_at_definition(self) -> None:
+        """Test that a signal subclass has its ID before first use."""
+
+        class TestSignal(SdlSignal):
+            _id: Optional[int] = None
+
+        assert TestSignal._id is not None
+        assert TestSignal.id() == TestSignal._id
+
+    def test_reset_all_ids_reassigns_every_subclass(self) -> None:
+        """Test that _reset_all_ids() gives every class a fresh, unique ID."""
+
+        class FirstSignal(SdlSignal):
+            pass
+
+        class SecondSignal(FirstSignal):
+            pass
+
+        SdlIdGenerator.reset()
+        SdlSignal._reset_all_ids()
+        issued = SdlIdGenerator.id()
+
+        ids = {SdlSignal.id(), FirstSignal.id(), SecondSignal.id()}
+        assert len(ids) == 3
+        assert all(0 < signal_id <= issued for signal_id in ids)
+
+        class LaterSignal(SdlSignal):
+            pass
+
+        assert LaterSignal.id() == issued + 1
+
+    def test_reset_all_ids_keeps_definition_order(self) -> None:
+        """Test that _reset_all_ids() renumbers classes in definition order."""
+        classes = [type(f"OrderedSignal{n}", (SdlSignal,), {}) for n in range(20)]
+
+        SdlIdGenerator.reset()
+        SdlSignal._reset_all_ids()
+
+        ids = [cls.id() for cls in classes]
+        assert ids == sorted(ids)
+
+    def test_collected_signal_class_leaves_registry(self) -> None:
+        """Test that a garbage-collected signal class is dropped from the registry."""
+        gc.collect()
+        registered = len(signal_module._signal_classes)
+        temporary = type("TemporarySignal", (SdlSignal,), {})
+        assert len(signal_module._signal_classes) == registered + 1
+
+        del temporary
+        gc.collect()
+
+        assert len(signal_module._signal_classes) == registered
+
+    def test_signal_class_name_stamped_at_definition(self) -> None:
+        """Test that the default signal name is stored on the class."""
+
+        class NamedSignal(SdlSignal):
+            pass
+
+        assert NamedSignal._class_name == "NamedSignal"
+        assert NamedSignal.create().name() == "NamedSignal"
+        assert SdlSignal.create().name() == "SdlSignal"
+
+    def test_release_recycles_poolable_signal(self) -> None:
+        """Test that a released poolable signal is reused with a fresh state."""
+
+        class PooledSignal(SdlSignal):
+            _poolable = True
+
+        signal = PooledSignal.create("first")
+        signal.set_src("src")
+        signal.set_dst("dst")
+        signal.release()
+
+        reused = PooledSignal.create("second")
+        assert reused is signal
+        assert reused.data == "second"
+        assert reused.src() is None
+        assert reused.dst() is None
+        assert PooledSignal._pool == []
+
+    def test_release_ignored_for_regular_signal(self) -> None:
+        """Test that releasing a signal that is not poolable keeps it out of reuse."""
+
+        class PlainSignal(SdlSignal):
+            pass
+
+        signal = PlainSignal.create()
+        signal.release()
+
+        assert PlainSignal._pool == []
+        assert PlainSignal.create() is not signal
+
     def test_signal_name(self) -> None:
         """Test signal name matches class name."""
 
@@ -4,6 +4,8 @@ This module tests Priority 2 matching - star state handlers that match
 specific signals from any state.
 """
 
+from itertools import product
+
 import pytest
 
 from pysdl.id_generator import SdlIdGenerator
@@ -12,7 +14,6 @@ from pysdl.signal import SdlSignal
 from pysdl.state import SdlState, star, start
 from pysdl.system import SdlSystem
 from pysdl.system_signals import SdlStarSignal, SdlStartSignal
-from pysdl.timer import SdlTimer
 
 
 # Test signals
@@ -81,15 +82,8 @@ class TestStarStateMatching:
     @pytest.fixture(autouse=True)
     def reset_state(self) -> None:
         """Reset state before each test."""
-        SdlIdGenerator._id = 0
-        # Reset Signal and Timer class IDs to prevent cross-test contamination
-        SdlSignal._id = None
-        SdlTimer._id = None
-        # Also reset test signal IDs to prevent collision
-        TestSignalA._id = None
-        TestSignalB._id = None
-        EmergencyStopSignal._id = None
-        SdlStarSignal._id = None
+        SdlIdGenerator.reset()
+        SdlSignal._reset_all_ids()
 
     @pytest.mark.asyncio
     async def test_star_state_handler_works_from_any_state(self, sdl_system):
@@ -168,11 +162,12 @@ class TestStarStateMatching:
         ]
 
         # Test emergency stop from each state
+        expected = process.handle_emergency_stop
         for state in states:
             await process.next_state(state)
             signal = EmergencyStopSignal.create()
             handler = process.lookup_transition(signal)
-            assert handler == process.handle_emergency_stop
+            assert handler == expected
 
     @pytest.mark.asyncio
     async def test_star_state_matches_only_specific_signal(self, sdl_system):
@@ -421,15 +416,8 @@ class TestStarSignalMatching:
     @pytest.fixture(autouse=True)
     def reset_state(self) -> None:
         """Reset state before each test."""
-        SdlIdGenerator._id = 0
-        # Reset Signal and Timer class IDs to prevent cross-test contamination
-        SdlSignal._id = None
-        SdlTimer._id = None
-        # Also reset test signal IDs to prevent collision
-        TestSignalA._id = None
-        TestSignalB._id = None
-        EmergencyStopSignal._id = None
-        SdlStarSignal._id = None
+        SdlIdGenerator.reset()
+        SdlSignal._reset_all_ids()
 
     @pytest.mark.asyncio
     async def test_star_signal_catches_any_signal_type(self, sdl_system):
@@ -643,15 +631,8 @@ class TestPriorityAndDoubleStar:
     @pytest.fixture(autouse=True)
     def reset_state(self) -> None:
         """Reset state before each test."""
-        SdlIdGenerator._id = 0
-        # Reset Signal and Timer class IDs to prevent cross-test contamination
-        SdlSignal._id = None
-        SdlTimer._id = None
-        # Also reset test signal IDs to prevent collision
-        TestSignalA._id = None
-        TestSignalB._id = None
-        EmergencyStopSignal._id = None
-        SdlStarSignal._id = None
+        SdlIdGenerator.reset()
+        SdlSignal._reset_all_ids()
 
     @pytest.mark.asyncio
     async def test_all_four_priority_levels(self, sdl_system):
@@ -699,40 +680,42 @@ class TestPriorityAndDoubleStar:
                 self.priority_4_called = True
 
         process = await ComprehensiveProcess.create(None, system=sdl_system)
-        await process.next_state(ComprehensiveProcess.state_active)
-
-        # TestSignalA in state_active: Priority 1 (exact match)
-        assert (
-            process.lookup_transition(TestSignalA.create())
-            == process.priority_1_handler
-        )
 
-        # TestSignalB in state_active: Priority 2 (star state)
-        assert (
-            process.lookup_transition(TestSignalB.create())
-            == process.priority_2_handler
-        )
+        # Resolve each bound method once rather than per assertion
+        p1 = process.priority_1_handler
+        p2 = process.priority_2_handler
+        p3 = process.priority_3_handler
+        p4 = process.priority_4_handler
+        active = ComprehensiveProcess.state_active
+        other = ComprehensiveProcess.state_other
+
+        # (state, signal, expected handler) - one row per priority level
+        dispatch_table = [
+            (active, TestSignalA, p1),
+            (active, TestSignalB, p2),
+            (active, EmergencyStopSignal, p3),
+            (other, TestSignalB, p2),
+            (other, EmergencyStopSignal, p4),
+        ]
 
-        # EmergencyStopSignal in state_active: Priority 3 (star signal)
-        assert (
-            process.lookup_transition(EmergencyStopSignal.create())
-            == process.priority_3_handler
-        )
+        for state, signal_class, expected in dispatch_table:
+            await process.next_state(state)
+            handler = process.lookup_transition(signal_class.create())
+            assert handler == expected, f"{signal_class.__name__} in {state}"
 
-        # Move to other state
-        await process.next_state(ComprehensiveProcess.state_other)
+    @pytest.mark.asyncio
+    async def test_lookup_returns_registered_handler_object(self, sdl_system):
+        """Test that repeated lookups return the same bound-method object.
 
-        # TestSignalB in state_other: Priority 2 (star state still works)
-        assert (
-            process.lookup_transition(TestSignalB.create())
-            == process.priority_2_handler
-        )
+        The state machine stores the bound methods passed to _event(), so
+        dispatch never creates a new method object per signal.
+        """
+        process = await ProcessWithStarState.create(None, system=sdl_system)
 
-        # EmergencyStopSignal in state_other: Priority 4 (double star - fallback)
-        assert (
-            process.lookup_transition(EmergencyStopSignal.create())
-            == process.priority_4_handler
-        )
+        first = process.lookup_transition(EmergencyStopSignal.create())
+        second = process.lookup_transition(EmergencyStopSignal.create())
+        assert first is not None
+        assert first is second
 
     @pytest.mark.asyncio
     async def test_priority_cascade(self, sdl_system):
@@ -763,20 +746,18 @@ class TestPriorityAndDoubleStar:
                 self.calls.append("priority_4")
 
         process = await CascadeProcess.create(None, system=sdl_system)
-        await process.next_state(CascadeProcess.state_one)
 
-        # In state_one: Priority 3 matches (state + star signal)
-        assert (
-            process.lookup_transition(TestSignalA.create())
-            == process.priority_3_handler
-        )
+        # state_one: Priority 3 (state + star signal)
+        # state_two: Priority 4 (double star fallback)
+        dispatch_table = [
+            (CascadeProcess.state_one, TestSignalA, "priority_3_handler"),
+            (CascadeProcess.state_two, TestSignalA, "priority_4_handler"),
+        ]
 
-        # In state_two: Priority 4 matches (double star fallback)
-        await process.next_state(CascadeProcess.state_two)
-        assert (
-            process.lookup_transition(TestSignalA.create())
-            == process.priority_4_handler
-        )
+        for state, signal_class, handler_name in dispatch_table:
+            await process.next_state(state)
+            handler = process.lookup_transition(signal_class.create())
+            assert handler == getattr(process, handler_name)
 
     @pytest.mark.asyncio
     async def test_double_star_catch_all(self, sdl_system):
@@ -818,11 +799,12 @@ class TestPriorityAndDoubleStar:
             EmergencyStopSignal.create(),
         ]
 
-        for state in states:
-            await process.next_state(state)
-            for signal in signals:
-                handler = process.lookup_transition(signal)
-                assert handler == process.catch_everything
+        # Only lookup is under test, so set the state directly instead of
+        # awaiting next_state() for every combination
+        for state, signal in product(states, signals):
+            process._state = state
+            handler = process.lookup_transition(signal)
+            assert handler == process.catch_everything
 
     @pytest.mark.asyncio
     async def test_double_star_lowest_priority(self, sdl_system):
@@ -943,38 +925,25 @@ class TestPriorityAndDoubleStar:
 
         process = await RobustProcess.create(None, system=sdl_system)
 
-        # Test in idle state
-        await process.next_state(RobustProcess.state_idle)
-        assert (
-            process.lookup_transition(EmergencyStopSignal.create())
-            == process.emergency_stop
-        )  # Priority 2
-        assert (
-            process.lookup_transition(TestSignalA.create()) == process.log_unexpected
-        )  # Priority 4
-
-        # Test in connecting state
-        await process.next_state(RobustProcess.state_connecting)
-        assert (
-            process.lookup_transition(EmergencyStopSignal.create())
-            == process.emergency_stop
-        )  # Priority 2
-        assert (
-            process.lookup_transition(TestSignalA.create()) == process.buffer_signal
-        )  # Priority 3
+        dispatch_table = [
+            # idle: only the wildcards apply
+            (RobustProcess.state_idle, EmergencyStopSignal, "emergency_stop"),  # P2
+            (RobustProcess.state_idle, TestSignalA, "log_unexpected"),  # P4
+            # connecting: buffer everything except emergency stop
+            (RobustProcess.state_connecting, EmergencyStopSignal, "emergency_stop"),
+            (RobustProcess.state_connecting, TestSignalA, "buffer_signal"),  # P3
+            # ready: exact handlers win
+            (RobustProcess.state_ready, TestSignalA, "handle_work"),  # P1
+            (RobustProcess.state_ready, TestSignalB, "handle_more_work"),  # P1
+            (RobustProcess.state_ready, EmergencyStopSignal, "emergency_stop"),  # P2
+        ]
 
-        # Test in ready state
-        await process.next_state(RobustProcess.state_ready)
-        assert (
-            process.lookup_transition(TestSignalA.create()) == process.handle_work
-        )  # Priority 1
-        assert (
-            process.lookup_transition(TestSignalB.create()) == process.handle_more_work
-        )  # Priority 1
-        assert (
-            process.lookup_transition(EmergencyStopSignal.create())
-            == process.emergency_stop
-        )  # Priority 2
+        for state, signal_class, handler_name in dispatch_table:
+            await process.next_state(state)
+            handler = process.lookup_transition(signal_class.create())
+            assert handler == getattr(process, handler_name), (
+                f"{signal_class.__name__} in {state} should use {handler_name}"
+            )
 
     @pytest.mark.asyncio
     async def test_double_star_with_overrides(self, sdl_system):
@@ -1036,15 +1005,8 @@ class TestStarMatchingIntegration:
     @pytest.fixture(autouse=True)
     def reset_state(self) -> None:
         """Reset state before each test."""
-        SdlIdGenerator._id = 0
-        # Reset Signal and Timer class IDs to prevent cross-test contamination
-        SdlSignal._id = None
-        SdlTimer._id = None
-        # Also reset test signal IDs to prevent collision
-        TestSignalA._id = None
-        TestSignalB._id = None
-        EmergencyStopSignal._id = None
-        SdlStarSignal._id = None
+        SdlIdGenerator.reset()
+        SdlSignal._reset_all_ids()
 
     @pytest.mark.asyncio
     async def test_star_state_emergency_stop_integration(self, sdl_system):
@@ -1137,7 +1099,7 @@ class TestStarMatchingIntegration:
                 await self.next_state(self.state_initializing)
 
             async def buffer_it(self, signal):
-                self.buffered.append(type(signal).__name__)
+                self.buffered.append(signal.name())
 
             async def process_a(self, signal):
                 self.processed.append("A")
@@ -1164,9 +1126,7 @@ class TestStarMatchingIntegration:
             await sdl_system.output(sig_b)
 
         # Process all buffered signals (star signal handler should catch them)
-        for _ in range(6):
-            signal = await sdl_system.get_next_signal()
-            await sdl_system._process_signal(signal)
+        assert await sdl_system.drain_ready() == 6
 
         # Verify signals were buffered (all should hit star signal handler)
         assert len(proc.buffered) == 6  # 3 A + 3 B
@@ -1230,9 +1190,7 @@ class TestStarMatchingIntegration:
             await sdl_system.output(sig)
 
         # Process logger signals
-        for _ in range(5):
-            signal = await sdl_system.get_next_signal()
-            await sdl_system._process_signal(signal)
+        assert await sdl_system.drain_ready() == 5
 
         # Send emergency stop to supervisor (star state catches it)
         emergency = EmergencyStopSignal.create()
@@ -1378,9 +1336,7 @@ class TestStarMatchingIntegration:
             await sdl_system.output(sig)
 
         # Process all signals
-        for _ in range(5):
-            signal = await sdl_system.get_next_signal()
-            await sdl_system._process_signal(signal)
+        assert await sdl_system.drain_ready() == 5
 
         # Verify signal routing by priority
         assert (
@@ -4,6 +4,8 @@ This module tests the SdlState class methods including string representation,
 formatting, id/name retrieval, and name modification.
 """
 
+import pytest
+
 from pysdl.state import SdlState, star, start, wait
 
 
@@ -34,14 +36,13 @@ class TestSdlState:
     def test_state_str(self) -> None:
         """Test __str__ method returns formatted state name."""
         state = SdlState("formatted_state")
-        # The __str__ method calls self.name which returns self._name
-        # But looking at line 17, it's f"{self.name}" which calls the name() method
+        # __str__ returns the stored name directly
         assert str(state) == "formatted_state"
 
     def test_state_format(self) -> None:
         """Test __format__ method for string formatting."""
         state = SdlState("format_test")
-        # __format__ calls format(str(self.name()), formatspec)
+        # __format__ calls format(self._name, formatspec)
         # "format_test" is 11 chars, so >20 means 9 spaces before it
         formatted = f"{state:>20}"
         assert formatted == "         format_test"
@@ -68,6 +69,7 @@ class TestSdlState:
         assert state.name() == "modified"
         assert state.id() == "modified"
         assert str(state) == "modified"
+        assert f"{state:>10}" == "  modified"
 
     def test_predefined_start_state(self) -> None:
         """Test predefined 'start' state."""
@@ -124,3 +126,10 @@ class TestSdlState:
         state._set_name("mutable")
         assert state.name() != original_name
         assert state.name() == "mutable"
+
+    def test_state_has_no_instance_dict(self) -> None:
+        """Test that states store their name in a slot, not a __dict__."""
+        state = SdlState("slotted")
+        assert not hasattr(state, "__dict__")
+        with pytest.raises(AttributeError):
+            state.extra = 1  # type: ignore[attr-defined]
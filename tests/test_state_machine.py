@@ -3,15 +3,22 @@
 This module tests FSM creation, event registration, handler lookup, and state transitions.
 """
 
-from typing import Optional
-
 import pytest
 
 from pysdl.exceptions import ValidationError
 from pysdl.id_generator import SdlIdGenerator
 from pysdl.signal import SdlSignal
-from pysdl.state import SdlState
+from pysdl.state import SdlState, star
 from pysdl.state_machine import SdlStateMachine
+from pysdl.system_signals import SdlStarSignal
+
+
+class Signal1(SdlSignal):
+    """First signal shared by the state machine tests."""
+
+
+class Signal2(SdlSignal):
+    """Second signal shared by the state machine tests."""
 
 
 class TestSdlStateMachine:
@@ -20,7 +27,8 @@ class TestSdlStateMachine:
     @pytest.fixture(autouse=True)
     def reset_state(self) -> None:
         """Reset state before each test."""
-        SdlIdGenerator._id = 0
+        SdlIdGenerator.reset()
+        SdlSignal._reset_all_ids()
 
     @pytest.fixture
     def fsm(self) -> SdlStateMachine:
@@ -62,12 +70,8 @@ class TestSdlStateMachine:
 
     def test_fsm_set_event(self, fsm: SdlStateMachine) -> None:
         """Test setting an event."""
-
-        class TestSignal(SdlSignal):
-            pass
-
-        result = fsm.event(TestSignal)
-        assert fsm._event == TestSignal.id()
+        result = fsm.event(Signal1)
+        assert fsm._event == Signal1.id()
         assert result is fsm  # Should return self for chaining
 
     def test_fsm_set_event_rejects_none(self, fsm: SdlStateMachine) -> None:
@@ -93,24 +97,16 @@ class TestSdlStateMachine:
         """Test setting a handler."""
         state = SdlState("test_state")
 
-        class TestSignal(SdlSignal):
-            pass
-
-        result = fsm.state(state).event(TestSignal).handler(self.dummy_handler)
+        result = fsm.state(state).event(Signal1).handler(self.dummy_handler)
         assert result is fsm  # Should return self for chaining
-        assert state in fsm._handlers
-        assert TestSignal.id() in fsm._handlers[state]
+        assert (state, Signal1.id()) in fsm._handlers
 
     def test_fsm_set_handler_requires_state(self, fsm: SdlStateMachine) -> None:
         """Test that setting handler without state raises ValidationError."""
-
-        class TestSignal(SdlSignal):
-            pass
-
         with pytest.raises(
             ValidationError, match="State must be set before adding handler"
         ):
-            fsm.event(TestSignal).handler(self.dummy_handler)
+            fsm.event(Signal1).handler(self.dummy_handler)
 
     def test_fsm_set_handler_requires_event(self, fsm: SdlStateMachine) -> None:
         """Test that setting handler without event raises ValidationError."""
@@ -124,11 +120,8 @@ class TestSdlStateMachine:
         """Test that setting non-callable handler raises ValidationError."""
         state = SdlState("test_state")
 
-        class TestSignal(SdlSignal):
-            pass
-
         with pytest.raises(ValidationError, match="Handler must be callable"):
-            fsm.state(state).event(TestSignal).handler("not_callable")  # type: ignore
+            fsm.state(state).event(Signal1).handler("not_callable")  # type: ignore
 
     def test_fsm_done(self, fsm: SdlStateMachine) -> None:
         """Test done() method."""
@@ -138,22 +131,26 @@ class TestSdlStateMachine:
         """Test finding an existing handler."""
         state = SdlState("test_state")
 
-        class TestSignal(SdlSignal):
-            pass
-
-        fsm.state(state).event(TestSignal).handler(self.dummy_handler)
+        fsm.state(state).event(Signal1).handler(self.dummy_handler)
 
-        found = fsm.find(state, TestSignal.id())
+        found = fsm.find(state, Signal1.id())
         assert found == self.dummy_handler
 
-    def test_fsm_find_rejects_none_state(self, fsm: SdlStateMachine) -> None:
-        """Test finding handler with None state raises ValidationError."""
+    def test_fsm_lookup_matches_find(self, fsm: SdlStateMachine) -> None:
+        """Test that lookup() resolves the same handlers as find()."""
+        state = SdlState("test_state")
+        other = SdlState("other_state")
 
-        class TestSignal(SdlSignal):
-            pass
+        fsm.state(state).event(Signal1).handler(self.dummy_handler)
+        fsm.done()
 
+        assert fsm.lookup(state, Signal1.id()) == self.dummy_handler
+        assert fsm.lookup(other, Signal1.id()) is None
+
+    def test_fsm_find_rejects_none_state(self, fsm: SdlStateMachine) -> None:
+        """Test finding handler with None state raises ValidationError."""
         with pytest.raises(ValidationError, match="Cannot find handler for None state"):
-            fsm.find(None, TestSignal.id())  # type: ignore
+            fsm.find(None, Signal1.id())  # type: ignore
 
     def test_fsm_find_rejects_none_event(self, fsm: SdlStateMachine) -> None:
         """Test finding handler with None event raises ValidationError."""
@@ -166,10 +163,7 @@ class TestSdlStateMachine:
         """Test finding a non-existent handler returns None."""
         state = SdlState("test_state")
 
-        class TestSignal(SdlSignal):
-            pass
-
-        found = fsm.find(state, TestSignal.id())
+        found = fsm.find(state, Signal1.id())
         assert found is None
 
     def test_fsm_find_wrong_state(self, fsm: SdlStateMachine) -> None:
@@ -177,24 +171,15 @@ class TestSdlStateMachine:
         state1 = SdlState("state1")
         state2 = SdlState("state2")
 
-        class TestSignal(SdlSignal):
-            pass
+        fsm.state(state1).event(Signal1).handler(self.dummy_handler)
 
-        fsm.state(state1).event(TestSignal).handler(self.dummy_handler)
-
-        found = fsm.find(state2, TestSignal.id())
+        found = fsm.find(state2, Signal1.id())
         assert found is None
 
     def test_fsm_find_wrong_event(self, fsm: SdlStateMachine) -> None:
         """Test finding handler with wrong event returns None."""
         state = SdlState("test_state")
 
-        class Signal1(SdlSignal):
-            _id: Optional[int] = None
-
-        class Signal2(SdlSignal):
-            _id: Optional[int] = None
-
         fsm.state(state).event(Signal1).handler(self.dummy_handler)
 
         # Signal2 should not find the handler registered for Signal1
@@ -206,20 +191,17 @@ class TestSdlStateMachine:
         state1 = SdlState("state1")
         state2 = SdlState("state2")
 
-        class TestSignal(SdlSignal):
-            pass
-
         async def handler1(signal: SdlSignal) -> None:
             pass
 
         async def handler2(signal: SdlSignal) -> None:
             pass
 
-        fsm.state(state1).event(TestSignal).handler(handler1)
-        fsm.state(state2).event(TestSignal).handler(handler2)
+        fsm.state(state1).event(Signal1).handler(handler1)
+        fsm.state(state2).event(Signal1).handler(handler2)
 
-        found1 = fsm.find(state1, TestSignal.id())
-        found2 = fsm.find(state2, TestSignal.id())
+        found1 = fsm.find(state1, Signal1.id())
+        found2 = fsm.find(state2, Signal1.id())
 
         assert found1 is handler1
         assert found2 is handler2
@@ -228,12 +210,6 @@ class TestSdlStateMachine:
         """Test registering handlers for multiple events in same state."""
         state = SdlState("test_state")
 
-        class Signal1(SdlSignal):
-            _id: Optional[int] = None
-
-        class Signal2(SdlSignal):
-            _id: Optional[int] = None
-
         async def handler1(signal: SdlSignal) -> None:
             pass
 
@@ -254,12 +230,6 @@ class TestSdlStateMachine:
         state1 = SdlState("state1")
         state2 = SdlState("state2")
 
-        class Signal1(SdlSignal):
-            _id: Optional[int] = None
-
-        class Signal2(SdlSignal):
-            _id: Optional[int] = None
-
         async def handler1(signal: SdlSignal) -> None:
             pass
 
@@ -279,19 +249,16 @@ class TestSdlStateMachine:
         """Test that re-registering same state/event overwrites handler."""
         state = SdlState("test_state")
 
-        class TestSignal(SdlSignal):
-            pass
-
         async def handler1(signal: SdlSignal) -> None:
             pass
 
         async def handler2(signal: SdlSignal) -> None:
             pass
 
-        fsm.state(state).event(TestSignal).handler(handler1)
-        fsm.state(state).event(TestSignal).handler(handler2)
+        fsm.state(state).event(Signal1).handler(handler1)
+        fsm.state(state).event(Signal1).handler(handler2)
 
-        found = fsm.find(state, TestSignal.id())
+        found = fsm.find(state, Signal1.id())
         assert found is handler2  # Should be the last one registered
 
     def test_fsm_tracks_states(self, fsm: SdlStateMachine) -> None:
@@ -299,11 +266,8 @@ class TestSdlStateMachine:
         state1 = SdlState("state1")
         state2 = SdlState("state2")
 
-        class TestSignal(SdlSignal):
-            pass
-
-        fsm.state(state1).event(TestSignal).handler(self.dummy_handler)
-        fsm.state(state2).event(TestSignal).handler(self.dummy_handler)
+        fsm.state(state1).event(Signal1).handler(self.dummy_handler)
+        fsm.state(state2).event(Signal1).handler(self.dummy_handler)
 
         assert state1 in fsm._states
         assert state2 in fsm._states
@@ -312,14 +276,91 @@ class TestSdlStateMachine:
         """Test that FSM tracks all registered events."""
         state = SdlState("test_state")
 
-        class Signal1(SdlSignal):
-            _id: Optional[int] = None
-
-        class Signal2(SdlSignal):
-            _id: Optional[int] = None
-
         fsm.state(state).event(Signal1).handler(self.dummy_handler)
         fsm.state(state).event(Signal2).handler(self.dummy_handler)
 
         assert Signal1.id() in fsm._events
         assert Signal2.id() in fsm._events
+
+    def test_fsm_done_compiles_transitions(self, fsm: SdlStateMachine) -> None:
+        """Test that done() precomputes the transition table."""
+        state = SdlState("test_state")
+
+        fsm.state(state).event(Signal1).handler(self.dummy_handler)
+        assert fsm._table is None
+
+        fsm.done()
+        assert fsm._table == (self.dummy_handler,)
+
+    def test_fsm_handler_after_done_is_found(self, fsm: SdlStateMachine) -> None:
+        """Test that registering a handler after done() invalidates the table."""
+        state = SdlState("test_state")
+
+        async def handler1(signal: SdlSignal) -> None:
+            pass
+
+        async def handler2(signal: SdlSignal) -> None:
+            pass
+
+        fsm.state(state).event(Signal1).handler(handler1)
+        fsm.done()
+        fsm.state(state).event(Signal2).handler(handler2)
+
+        assert fsm.find(state, Signal1.id()) is handler1
+        assert fsm.find(state, Signal2.id()) is handler2
+
+    def test_fsm_table_is_flat_row_major(self, fsm: SdlStateMachine) -> None:
+        """Test that the compiled table is one tuple laid out row by row."""
+        state1 = SdlState("state1")
+        state2 = SdlState("state2")
+
+        async def handler1(signal: SdlSignal) -> None:
+            pass
+
+        async def handler2(signal: SdlSignal) -> None:
+            pass
+
+        fsm.state(state1).event(Signal1).handler(handler1)
+        fsm.state(state2).event(Signal2).handler(handler2)
+        fsm.done()
+
+        assert fsm._n_events == 2
+        assert fsm._table == (handler1, None, None, handler2)
+
+    def test_fsm_new_state_after_done_recompiles(self, fsm: SdlStateMachine) -> None:
+        """Test that registering a state after done() does not reuse stale rows."""
+        state1 = SdlState("state1")
+        state2 = SdlState("state2")
+
+        fsm.state(state1).event(Signal1).handler(self.dummy_handler)
+        fsm.done()
+        fsm.state(state2).event(Signal1)
+
+        assert fsm._table is None
+        assert fsm.find(state2, Signal1.id()) is None
+
+    def test_fsm_tracks_wildcard_presence(self, fsm: SdlStateMachine) -> None:
+        """Test that compiling records whether wildcard handlers exist."""
+        state = SdlState("state")
+
+        fsm.state(state).event(Signal1).handler(self.dummy_handler)
+        fsm.done()
+        assert fsm._has_wildcards is False
+        assert fsm.find(state, Signal2.id()) is None
+
+        fsm.state(star).event(SdlStarSignal).handler(self.dummy_handler)
+        fsm.done()
+        assert fsm._has_wildcards is True
+        assert fsm.find(state, Signal2.id()) == self.dummy_handler
+
+    def test_fsm_assigns_dense_indices(self, fsm: SdlStateMachine) -> None:
+        """Test that states and events get stable row/column indices."""
+        state1 = SdlState("state1")
+        state2 = SdlState("state2")
+
+        fsm.state(state1).event(Signal1).handler(self.dummy_handler)
+        fsm.state(state2).event(Signal2).handler(self.dummy_handler)
+        fsm.state(state1).event(Signal2).handler(self.dummy_handler)
+
+        assert fsm._states == {state1: 0, state2: 1}
+        assert fsm._events == {Signal1.id(): 0, Signal2.id(): 1}
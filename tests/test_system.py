@@ -3,7 +3,8 @@
 This module tests SdlSystem event loop, signal routing, process management, and timer management.
 """
 
-from typing import Optional
+import asyncio
+from unittest.mock import patch
 
 import pytest
 
@@ -16,23 +17,32 @@ from pysdl.system_signals import SdlStartSignal
 from pysdl.timer import SdlTimer
 
 
+class Timer1(SdlTimer):
+    """Timer type distinct from Timer2, so both can run at once."""
+
+
+class Timer2(SdlTimer):
+    """Timer type distinct from Timer1, so both can run at once."""
+
+
+@pytest.fixture(scope="module")
+def sdl_system():
+    """Provide one SdlSystem instance shared by the tests in this module."""
+    return SdlSystem()
+
+
 class TestSdlSystem:
     """Test cases for SdlSystem class."""
 
     @pytest.fixture(autouse=True)
-    def reset_state(self):
+    def reset_state(self, sdl_system):
         """Reset state before each test."""
         from pysdl.signal import SdlSignal
-        from pysdl.timer import SdlTimer
-
-        SdlIdGenerator._id = 0
-        SdlSignal._id = None
-        SdlTimer._id = None
 
-    @pytest.fixture
-    def sdl_system(self):
-        """Provide a fresh SdlSystem instance for each test."""
-        return SdlSystem()
+        SdlIdGenerator.reset()
+        SdlSignal._reset_all_ids()
+        # The system is shared by the module, so empty it instead of rebuilding
+        sdl_system.reset()
 
     class TestProcess(SdlProcess):
         """Test process for system tests."""
@@ -120,6 +130,33 @@ class TestSdlSystem:
 
         assert process not in sdl_system.ready_list
 
+    def test_system_ready_list_keeps_one_entry_per_signal(self, sdl_system) -> None:
+        """Test that the ready list keeps one entry per signal, grouped by process."""
+        process = self.TestProcess(None, system=sdl_system)
+        other = self.TestProcess(None, system=sdl_system)
+        ready_list = sdl_system.ready_list
+
+        ready_list.append(process)
+        ready_list.append(other)
+        ready_list.append(process)
+        assert len(ready_list) == 3
+        assert ready_list.count(process) == 2
+        assert list(ready_list) == [process, process, other]
+
+        ready_list.remove(process)
+        assert ready_list.count(process) == 1
+        assert ready_list.discard(process) == 1
+        assert process not in ready_list
+        assert len(ready_list) == 1
+
+        with pytest.raises(ValueError, match="not in the ready list"):
+            ready_list.remove(process)
+
+        # A process that left the list goes to the end when it comes back
+        ready_list.append(process)
+        assert list(ready_list) == [other, process]
+        assert repr(ready_list) == f"_ReadyList({{{other!r}: 1, {process!r}: 1}})"
+
     @pytest.mark.asyncio
     async def test_system_enqueue_signal(self, sdl_system) -> None:
         """Test enqueueing a signal."""
@@ -141,6 +178,23 @@ class TestSdlSystem:
         found = sdl_system.lookup_proc_map("NonExistent(0.0)")
         assert found is None
 
+    def test_system_lookup_prefix(self, sdl_system) -> None:
+        """Test looking up every process whose PID starts with a prefix."""
+        process1 = self.TestProcess(None, system=sdl_system)
+        process2 = self.TestProcess(None, system=sdl_system)
+        sdl_system.register(process1)
+        sdl_system.register(process2)
+
+        prefix = process1.pid().split("(")[0] + "("
+        found = sdl_system.lookup_prefix(prefix)
+        assert set(found) == {process1, process2}
+        assert sdl_system.lookup_prefix(process1.pid()) == [process1]
+        assert sdl_system.lookup_prefix("NonExistent(") == []
+
+        sdl_system.unregister(process1)
+        assert sdl_system.lookup_prefix(prefix) == [process2]
+        assert sdl_system.lookup_prefix("") == [process2]
+
     @pytest.mark.asyncio
     async def test_system_output_signal(self, sdl_system) -> None:
         """Test outputting signal to a process."""
@@ -193,14 +247,6 @@ class TestSdlSystem:
 
     def test_system_start_timer_multiple_for_same_process(self, sdl_system) -> None:
         """Test starting multiple timers for same process."""
-
-        # Create different timer types to avoid duplicate prevention
-        class Timer1(SdlTimer):
-            _id: Optional[int] = None  # Override to ensure unique ID
-
-        class Timer2(SdlTimer):
-            _id: Optional[int] = None  # Override to ensure unique ID
-
         timer1 = Timer1.create()
         timer1.set_src("Process(0.0)")
         timer2 = Timer2.create()
@@ -222,6 +268,25 @@ class TestSdlSystem:
         # Should only have one instance
         assert len(sdl_system.timer_map["Process(0.0)"]) == 1
 
+    def test_system_restart_equal_timer_replaces_running_one(self, sdl_system) -> None:
+        """Test that restarting an equal timer replaces it and moves it last."""
+        first = SdlTimer.create()
+        first.set_src("Process(0.0)")
+        other = SdlTimer.create()
+        other.set_src("Process(0.0)")
+        other.set_appcorr(1)
+        restarted = SdlTimer.create()
+        restarted.set_src("Process(0.0)")
+
+        sdl_system.startTimer(first)
+        sdl_system.startTimer(other)
+        sdl_system.startTimer(restarted)
+
+        bucket = sdl_system.timer_map["Process(0.0)"]
+        assert len(bucket) == 2
+        assert list(bucket) == [other, restarted]
+        assert list(bucket)[1] is restarted
+
     def test_system_stop_timer(self, sdl_system) -> None:
         """Test stopping a timer."""
         timer = SdlTimer.create()
@@ -250,14 +315,6 @@ class TestSdlSystem:
 
     def test_system_stop_timer_preserves_other_timers(self, sdl_system) -> None:
         """Test that stopping one timer preserves others."""
-
-        # Create different timer types to avoid duplicate prevention
-        class Timer1(SdlTimer):
-            _id: Optional[int] = None  # Override to ensure unique ID
-
-        class Timer2(SdlTimer):
-            _id: Optional[int] = None  # Override to ensure unique ID
-
         timer1 = Timer1.create()
         timer1.set_src("Process(0.0)")
         timer2 = Timer2.create()
@@ -291,6 +348,189 @@ class TestSdlSystem:
         retrieved = await sdl_system.get_next_signal()
         assert retrieved is signal
 
+    @pytest.mark.asyncio
+    async def test_system_get_next_signal_waits_for_enqueue(self, sdl_system) -> None:
+        """Test that get_next_signal blocks until a signal is enqueued."""
+        signal = SdlSignal.create()
+
+        getter = asyncio.ensure_future(sdl_system.get_next_signal())
+        await asyncio.sleep(0)
+        assert not getter.done()
+
+        await sdl_system.enqueue(signal)
+        assert await getter is signal
+        assert sdl_system._get_queue().empty()
+
+    @pytest.mark.asyncio
+    async def test_system_get_next_signals_returns_batch(self, sdl_system) -> None:
+        """Test that get_next_signals returns queued signals up to max_n."""
+        signals = [SdlSignal.create() for _ in range(5)]
+        for signal in signals:
+            await sdl_system.enqueue(signal)
+
+        assert await sdl_system.get_next_signals(max_n=3) == signals[:3]
+        assert await sdl_system.get_next_signals() == signals[3:]
+        assert sdl_system._get_queue().empty()
+
+    @pytest.mark.asyncio
+    async def test_system_get_next_signals_invalid_max_n(self, sdl_system) -> None:
+        """Test that a batch size below one raises ValidationError."""
+        from pysdl.exceptions import ValidationError
+
+        with pytest.raises(ValidationError, match="Batch size"):
+            await sdl_system.get_next_signals(max_n=0)
+
+    @pytest.mark.asyncio
+    async def test_system_run_stop_mid_batch_leaves_rest_queued(
+        self, sdl_system
+    ) -> None:
+        """Test that stop() from a handler ends dispatch within a batch."""
+        signals = [SdlSignal.create() for _ in range(5)]
+        for signal in signals:
+            await sdl_system.enqueue(signal)
+        dispatched = []
+
+        async def process_signal(signal: SdlSignal) -> None:
+            dispatched.append(signal)
+            sdl_system.stop()
+
+        dispatch = patch.object(
+            sdl_system, "_process_signal", side_effect=process_signal
+        )
+        with dispatch, patch.object(asyncio.get_running_loop(), "stop"):
+            assert await sdl_system.run() is True
+
+        assert dispatched == signals[:1]
+        assert await sdl_system.get_next_signals() == signals[1:]
+
+    @pytest.mark.asyncio
+    async def test_system_run_error_mid_batch_requeues_rest(self, sdl_system) -> None:
+        """Test that an unexpected handler error does not drop the batch rest."""
+        signals = [SdlSignal.create() for _ in range(5)]
+        for signal in signals:
+            await sdl_system.enqueue(signal)
+        dispatched = []
+
+        async def process_signal(signal: SdlSignal) -> None:
+            dispatched.append(signal)
+            if len(dispatched) == 1:
+                raise RuntimeError("Handler crashed")
+            sdl_system.stop()
+
+        dispatch = patch.object(
+            sdl_system, "_process_signal", side_effect=process_signal
+        )
+        with dispatch, patch.object(asyncio.get_running_loop(), "stop"):
+            assert await sdl_system.run() is True
+
+        assert dispatched == signals[:2]
+        assert await sdl_system.get_next_signals() == signals[2:]
+
+    @pytest.mark.asyncio
+    async def test_system_get_next_signal_after_timeout(self, sdl_system) -> None:
+        """Test that a get cancelled by a timeout does not break the queue."""
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(sdl_system.get_next_signal(), timeout=0.001)
+
+        signal = SdlSignal.create()
+        await sdl_system.enqueue(signal)
+        assert await sdl_system.get_next_signal() is signal
+
+    def test_system_queue_get_nowait_raises_when_empty(self, sdl_system) -> None:
+        """Test that get_nowait on an empty queue raises asyncio.QueueEmpty."""
+        with pytest.raises(asyncio.QueueEmpty):
+            sdl_system._get_queue().get_nowait()
+
+    @pytest.mark.asyncio
+    async def test_system_drain_ready_empty_queue(self, sdl_system) -> None:
+        """Test that draining an empty queue processes nothing."""
+        assert await sdl_system.drain_ready() == 0
+
+    @pytest.mark.asyncio
+    async def test_system_drain_ready_processes_queued_signals(
+        self, sdl_system
+    ) -> None:
+        """Test that drain_ready dispatches every queued signal."""
+        p1 = await self.TestProcess.create(None, system=sdl_system)
+        p2 = await self.TestProcess.create(None, system=sdl_system)
+
+        assert sdl_system._get_queue().qsize() == 2
+        assert await sdl_system.drain_ready() == 2
+        assert sdl_system._get_queue().empty()
+        assert p1.pid() in sdl_system.proc_map
+        assert p2.pid() in sdl_system.proc_map
+
+    @pytest.mark.asyncio
+    async def test_system_releases_poolable_signal_after_dispatch(
+        self, sdl_system
+    ) -> None:
+        """Test that a poolable signal goes back to its pool once handled."""
+
+        class PooledSignal(SdlSignal):
+            _poolable = True
+
+        process = self.TestProcess(None, system=sdl_system)
+        sdl_system.register(process)
+
+        signal = PooledSignal.create()
+        signal.set_dst(process.pid())
+        await sdl_system._process_signal(signal)
+
+        assert PooledSignal._pool == [signal]
+
+    @pytest.mark.asyncio
+    async def test_system_forwarded_poolable_signal_pooled_once(
+        self, sdl_system
+    ) -> None:
+        """Test that a signal released after each of two dispatches is pooled once."""
+
+        class PooledSignal(SdlSignal):
+            _poolable = True
+
+        receiver = self.TestProcess(None, system=sdl_system)
+        sdl_system.register(receiver)
+
+        class Forwarder(SdlProcess):
+            def _init_state_machine(self) -> None:
+                self._event(start, PooledSignal, self.forward)
+
+            async def forward(self, signal: SdlSignal) -> None:
+                await self.output(signal, receiver.pid())
+
+        forwarder = await Forwarder.create(None, system=sdl_system, start_signal=False)
+
+        signal = PooledSignal.create()
+        signal.set_dst(forwarder.pid())
+        await sdl_system.enqueue(signal)
+
+        # Forwarder re-sends it, then the receiver drops it; both release it
+        assert await sdl_system.drain_ready() == 2
+        assert PooledSignal._pool == [signal]
+        assert PooledSignal.create() is not PooledSignal.create()
+
+    @pytest.mark.asyncio
+    async def test_system_keeps_poolable_timer_after_dispatch(self, sdl_system) -> None:
+        """Test that an expired poolable timer is not pooled by the system."""
+
+        class PooledTimer(SdlTimer):
+            _poolable = True
+
+        process = self.TestProcess(None, system=sdl_system)
+        sdl_system.register(process)
+
+        timer = PooledTimer.create()
+        timer.set_src(process.pid())
+        timer.set_dst(process.pid())
+        timer.start(1000)
+        sdl_system.startTimer(timer)
+
+        await sdl_system.expire(timer.deadline())
+        assert await sdl_system.drain_ready() == 1
+
+        # The process may restart the same object, so it must stay out of the pool
+        assert not PooledTimer._pool
+        assert PooledTimer.create() is not timer
+
     @pytest.mark.asyncio
     async def test_system_expire_timers(self, sdl_system) -> None:
         """Test timer expiry mechanism."""
@@ -316,13 +556,6 @@ class TestSdlSystem:
         process = self.TestProcess(None, system=sdl_system)
         sdl_system.register(process)
 
-        # Create different timer types to avoid duplicate prevention
-        class Timer1(SdlTimer):
-            _id: Optional[int] = None  # Override to ensure unique ID
-
-        class Timer2(SdlTimer):
-            _id: Optional[int] = None  # Override to ensure unique ID
-
         timer1 = Timer1.create()
         timer1.set_src(process.pid())
         timer1.set_dst(process.pid())
@@ -342,6 +575,57 @@ class TestSdlSystem:
         assert timer2 in sdl_system.timer_map[process.pid()]
         assert timer1 not in sdl_system.timer_map[process.pid()]
 
+    @pytest.mark.asyncio
+    async def test_system_timer_appcorr_changed_while_running(self, sdl_system) -> None:
+        """Test that a running timer whose appcorr changes still fires and stops."""
+        process = self.TestProcess(None, system=sdl_system)
+        sdl_system.register(process)
+
+        timer = SdlTimer.create()
+        timer.set_src(process.pid())
+        timer.set_dst(process.pid())
+        timer.start(1000)
+        sdl_system.startTimer(timer)
+        timer.set_appcorr(5)
+
+        await sdl_system.expire(2000)
+
+        assert process.pid() not in sdl_system.timer_map
+        assert await sdl_system.get_next_signal() is timer
+
+        sdl_system.startTimer(timer)
+        timer.set_appcorr(6)
+        assert sdl_system.stopTimer(timer) is True
+        assert process.pid() not in sdl_system.timer_map
+
+    def test_system_restart_timer_with_new_appcorr(self, sdl_system) -> None:
+        """Test that restarting a timer under a new appcorr drops its old entry."""
+        timer = SdlTimer.create()
+        timer.set_src("Process(0.0)")
+        timer.set_appcorr(1)
+        timer.start(1000)
+        sdl_system.startTimer(timer)
+
+        timer.set_appcorr(2)
+        timer.start(2000)
+        sdl_system.startTimer(timer)
+
+        assert len(sdl_system.timer_map["Process(0.0)"]) == 1
+        assert sdl_system.stopTimer(timer) is True
+        assert "Process(0.0)" not in sdl_system.timer_map
+
+    def test_system_timer_bucket_repr_lists_timers(self, sdl_system) -> None:
+        """Test that printing a timer bucket shows the running timers."""
+        timer = SdlTimer.create()
+        timer.set_src("Process(0.0)")
+        timer.set_appcorr(3)
+        timer.start(1000)
+        sdl_system.startTimer(timer)
+
+        assert repr(sdl_system.timer_map["Process(0.0)"]) == (
+            f"_TimerBucket([{timer}])"
+        )
+
     @pytest.mark.asyncio
     async def test_system_expire_sends_timer_signal(self, sdl_system) -> None:
         """Test that expired timer sends signal."""
@@ -365,6 +649,73 @@ class TestSdlSystem:
         # Timer signal should be in queue
         assert not queue.empty()
 
+    @pytest.mark.asyncio
+    async def test_system_expire_skips_stopped_and_restarted_timers(
+        self, sdl_system
+    ) -> None:
+        """Test that stale heap entries never deliver a timer."""
+        process = self.TestProcess(None, system=sdl_system)
+        sdl_system.register(process)
+
+        stopped = Timer1.create()
+        stopped.set_src(process.pid())
+        stopped.set_dst(process.pid())
+        stopped.start(1000)
+        sdl_system.startTimer(stopped)
+        sdl_system.stopTimer(stopped)
+
+        restarted = Timer2.create()
+        restarted.set_src(process.pid())
+        restarted.set_dst(process.pid())
+        restarted.start(1000)
+        sdl_system.startTimer(restarted)
+        restarted.start(3000)
+        sdl_system.startTimer(restarted)
+
+        await sdl_system.expire(2000)
+        assert sdl_system._get_queue().empty()
+        assert restarted in sdl_system.timer_map[process.pid()]
+
+        await sdl_system.expire(3000)
+        assert sdl_system._get_queue().get_nowait() is restarted
+        assert sdl_system._get_queue().empty()
+        assert process.pid() not in sdl_system.timer_map
+
+    def test_system_deadline_heap_is_compacted(self, sdl_system) -> None:
+        """Test that restarting a timer does not grow the heap without bound."""
+        timer = SdlTimer.create()
+        timer.set_src("Process(0.0)")
+        for msec in range(1000):
+            timer.start(msec)
+            sdl_system.startTimer(timer)
+
+        assert len(sdl_system._deadlines) <= 65
+
+    @pytest.mark.asyncio
+    async def test_system_reset(self, sdl_system) -> None:
+        """Test that reset empties the system but keeps its containers."""
+        process = self.TestProcess(None, system=sdl_system)
+        sdl_system.register(process)
+        timer = SdlTimer.create()
+        timer.set_src(process.pid())
+        sdl_system.startTimer(timer)
+        sdl_system.ready_list.append(process)
+        await sdl_system.enqueue(SdlSignal.create())
+        sdl_system.stop()
+        proc_map = sdl_system.proc_map
+        queue = sdl_system._get_queue()
+
+        sdl_system.reset()
+
+        assert sdl_system.proc_map is proc_map
+        assert len(sdl_system.proc_map) == 0
+        assert sdl_system.lookup_prefix("") == []
+        assert len(sdl_system.timer_map) == 0
+        assert len(sdl_system.ready_list) == 0
+        assert sdl_system._get_queue() is queue
+        assert queue.empty()
+        assert sdl_system._stop is False
+
     def test_system_stop(self, sdl_system) -> None:
         """Test stopping the system."""
         assert sdl_system._stop is False
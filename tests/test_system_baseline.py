@@ -54,13 +54,19 @@ class BaselineTestProcess(SdlProcess):
         """Handle timeout signal."""
 
 
+@pytest.fixture(scope="module")
+def sdl_system():
+    """Provide one SdlSystem instance shared by the tests in this module."""
+    return SdlSystem()
+
+
 class TestSystemBaseline:
     """Test SdlSystem instance-based behavior."""
 
-    @pytest.fixture
-    def sdl_system(self):
-        """Provide a fresh SdlSystem instance for each test."""
-        return SdlSystem()
+    @pytest.fixture(autouse=True)
+    def reset_system(self, sdl_system):
+        """Empty the shared system before each test."""
+        sdl_system.reset()
 
     async def test_baseline_process_registration_with_global_system(self, sdl_system):
         """Verify process registration works with system instance.
@@ -125,11 +131,10 @@ class TestSystemBaseline:
         - Destination process is added to ready_list
         - Signal can be retrieved from system queue
         """
-        process = await BaselineTestProcess.create(None, system=sdl_system)
-
-        # Drain the start signal that was automatically sent
-        _ = await sdl_system.get_next_signal()
-        sdl_system.ready_list.clear()
+        # Register without a start signal so the queue starts empty
+        process = await BaselineTestProcess.create(
+            None, system=sdl_system, start_signal=False
+        )
 
         # Create and send signal
         signal = MessageSignal.create()
@@ -237,10 +242,10 @@ class TestSystemBaseline:
         - Expired timers are removed from timer_map
         - Non-expired timers remain in timer_map
         """
-        process = await BaselineTestProcess.create(None, system=sdl_system)
-
-        # Drain the start signal
-        _ = await sdl_system.get_next_signal()
+        # Register without a start signal so the queue starts empty
+        process = await BaselineTestProcess.create(
+            None, system=sdl_system, start_signal=False
+        )
 
         # Create timer that will expire
         timer1 = TimeoutTimer.create()
@@ -285,15 +290,16 @@ class TestSystemBaseline:
         - Signals route to correct process
         - Unregistering one process doesn't affect others
         """
-        process1 = await BaselineTestProcess.create(None, system=sdl_system)
-        process2 = await BaselineTestProcess.create(None, system=sdl_system)
-        process3 = await BaselineTestProcess.create(None, system=sdl_system)
-
-        # Drain start signals and clear ready list
-        _ = await sdl_system.get_next_signal()
-        _ = await sdl_system.get_next_signal()
-        _ = await sdl_system.get_next_signal()
-        sdl_system.ready_list.clear()
+        # Register without start signals so the queue starts empty
+        process1 = await BaselineTestProcess.create(
+            None, system=sdl_system, start_signal=False
+        )
+        process2 = await BaselineTestProcess.create(
+            None, system=sdl_system, start_signal=False
+        )
+        process3 = await BaselineTestProcess.create(
+            None, system=sdl_system, start_signal=False
+        )
 
         # Verify all registered
         assert len(sdl_system.proc_map) == 3
@@ -350,13 +356,13 @@ class TestSystemBaseline:
         - Signals are properly routed through system queue
         - Both processes maintain independent state
         """
-        sender = await BaselineTestProcess.create(None, system=sdl_system)
-        receiver = await BaselineTestProcess.create(None, system=sdl_system)
-
-        # Drain start signals and clear ready list
-        _ = await sdl_system.get_next_signal()
-        _ = await sdl_system.get_next_signal()
-        sdl_system.ready_list.clear()
+        # Register without start signals so the queue starts empty
+        sender = await BaselineTestProcess.create(
+            None, system=sdl_system, start_signal=False
+        )
+        receiver = await BaselineTestProcess.create(
+            None, system=sdl_system, start_signal=False
+        )
 
         # Sender sends message to receiver
         message = MessageSignal.create()
@@ -400,7 +406,7 @@ class TestSystemBaseline:
         # Verify flag set
         assert sdl_system._stop is True
 
-    async def test_baseline_queue_initialization_lazy(self, sdl_system):
+    async def test_baseline_queue_initialization_lazy(self):
         """Verify system queue is lazily initialized.
 
         This tests that:
@@ -408,6 +414,9 @@ class TestSystemBaseline:
         - First access creates queue via _get_queue()
         - Same queue instance used throughout
         """
+        # The shared system already has a queue, so use a new one here
+        sdl_system = SdlSystem()
+
         # Queue should start as None
         assert sdl_system._queue is None
 
@@ -433,11 +442,10 @@ class TestSystemBaseline:
         - Same process can appear multiple times if it receives multiple signals
         - Ready list is a simple list, not a set
         """
-        process = await BaselineTestProcess.create(None, system=sdl_system)
-
-        # Drain start signal and clear ready list
-        _ = await sdl_system.get_next_signal()
-        sdl_system.ready_list.clear()
+        # Register without a start signal so the queue starts empty
+        process = await BaselineTestProcess.create(
+            None, system=sdl_system, start_signal=False
+        )
 
         # Send multiple signals
         signal1 = MessageSignal.create()
@@ -539,13 +547,13 @@ class TestSystemBaseline:
         system1 = SdlSystem()
         system2 = SdlSystem()
 
-        # Create processes in each system
-        process1 = await BaselineTestProcess.create(None, system=system1)
-        process2 = await BaselineTestProcess.create(None, system=system2)
-
-        # Drain start signals
-        _ = await system1.get_next_signal()
-        _ = await system2.get_next_signal()
+        # Create processes in each system without start signals
+        process1 = await BaselineTestProcess.create(
+            None, system=system1, start_signal=False
+        )
+        process2 = await BaselineTestProcess.create(
+            None, system=system2, start_signal=False
+        )
 
         # Send signal in system1
         signal1 = MessageSignal.create()
@@ -583,15 +591,13 @@ class TestSystemBaseline:
         system1 = SdlSystem()
         system2 = SdlSystem()
 
-        # Create processes in each system
-        process1 = await BaselineTestProcess.create(None, system=system1)
-        process2 = await BaselineTestProcess.create(None, system=system2)
-
-        # Drain start signals and clear ready lists
-        _ = await system1.get_next_signal()
-        _ = await system2.get_next_signal()
-        system1.ready_list.clear()
-        system2.ready_list.clear()
+        # Create processes in each system without start signals
+        process1 = await BaselineTestProcess.create(
+            None, system=system1, start_signal=False
+        )
+        process2 = await BaselineTestProcess.create(
+            None, system=system2, start_signal=False
+        )
 
         # Send signal to process1 (adds to system1's ready list)
         signal1 = MessageSignal.create()
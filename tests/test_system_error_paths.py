@@ -4,6 +4,8 @@ This module tests error paths, exception handling, and edge cases in SdlSystem
 to achieve comprehensive coverage of the system.py module.
 """
 
+import re
+from typing import Optional
 from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
@@ -15,6 +17,7 @@ from pysdl.exceptions import (
     ValidationError,
 )
 from pysdl.id_generator import SdlIdGenerator
+from pysdl.logger import SdlLogger
 from pysdl.process import SdlProcess
 from pysdl.signal import SdlSignal
 from pysdl.state import start
@@ -22,10 +25,22 @@ from pysdl.system import SdlSystem
 from pysdl.system_signals import SdlStartSignal
 from pysdl.timer import SdlTimer
 
+# Expected error messages, compiled once for pytest.raises(match=...).
+_RE_INVALID_PID = re.compile("Process has invalid PID")
+_RE_ENQUEUE_NONE = re.compile("Cannot enqueue None")
+_RE_ENQUEUE_FAILED = re.compile("Failed to enqueue signal")
+_RE_INVALID_DST = re.compile("Invalid destination PID")
+_RE_NO_DESTINATION = re.compile("Signal has no destination")
+_RE_DELIVERY_FAILED = re.compile("Failed to deliver signal to process")
+_RE_NO_SOURCE_PID = re.compile("Timer has no source PID")
+_RE_QUEUE_GET_FAILED = re.compile("Failed to get signal from queue")
+
 
 class TestProcess(SdlProcess):
     """Test process for error path tests."""
 
+    __test__ = False  # Not a test class despite the Test prefix
+
     def _init_state_machine(self) -> None:
         """Initialize state machine."""
         self._event(start, SdlStartSignal, self.handle_start)
@@ -34,47 +49,77 @@ class TestProcess(SdlProcess):
         """Handle start signal."""
 
 
+class _StubProcess:
+    """Minimal stand-in for SdlProcess exposing only pid() and input()."""
+
+    def __init__(self, pid: object, input_error: Optional[Exception] = None) -> None:
+        self._pid = pid
+        self.input = AsyncMock(side_effect=input_error)
+
+    def pid(self) -> object:
+        return self._pid
+
+
+class _RaisingQueue:
+    """Queue stand-in whose put() and get() always raise the given error."""
+
+    def __init__(self, error: Exception) -> None:
+        self._error = error
+
+    async def put(self, signal: SdlSignal) -> None:
+        raise self._error
+
+    async def get(self) -> SdlSignal:
+        raise self._error
+
+
+@pytest.fixture(scope="module")
+def sdl_system():
+    """Provide one SdlSystem instance shared by the tests in this module."""
+    return SdlSystem()
+
+
+@pytest.fixture(scope="class")
+def process(sdl_system):
+    """Provide one TestProcess shared by a test class.
+
+    The tests only send it signals it has no handler for, so its state does
+    not change between tests. Each test adds it to the freshly reset system.
+    """
+    return TestProcess(None, system=sdl_system)
+
+
+@pytest.fixture
+def mock_warning():
+    """Patch SdlLogger.warning for the duration of a test."""
+    with patch.object(SdlLogger, "warning") as mock:
+        yield mock
+
+
 class TestSdlSystemErrorPaths:
     """Test cases for SdlSystem error handling and edge cases."""
 
     @pytest.fixture(autouse=True)
-    def reset_state(self):
+    def reset_state(self, sdl_system):
         """Reset state before each test."""
-        SdlIdGenerator._id = 0
-        SdlSignal._id = None
-        SdlTimer._id = None
-
-    @pytest.fixture
-    def sdl_system(self):
-        """Provide a fresh SdlSystem instance for each test."""
-        return SdlSystem()
+        SdlIdGenerator.reset()
+        SdlSignal._reset_all_ids()
+        # The system is shared by the module, so empty it instead of rebuilding
+        sdl_system.reset()
 
     # =====================================================================
     # register() Error Paths
     # =====================================================================
 
-    def test_register_process_with_invalid_pid_type(self, sdl_system) -> None:
-        """Test registering process with non-string PID raises ValidationError.
+    @pytest.mark.parametrize("bad_pid", [123, ""], ids=["non_string", "empty"])
+    def test_register_process_with_invalid_pid(self, sdl_system, bad_pid) -> None:
+        """Test registering process with a non-string or empty PID raises.
 
-        Covers line 69: Invalid PID type validation.
+        Covers line 69: Invalid PID validation.
         """
-        # Create a mock process with invalid PID (not a string)
-        mock_process = Mock(spec=SdlProcess)
-        mock_process.pid.return_value = 123  # Integer instead of string
+        mock_process = _StubProcess(bad_pid)
 
-        with pytest.raises(ValidationError, match="Process has invalid PID"):
-            sdl_system.register(mock_process)
-
-    def test_register_process_with_empty_pid(self, sdl_system) -> None:
-        """Test registering process with empty PID raises ValidationError.
-
-        Covers line 69: Invalid PID validation (empty string).
-        """
-        # Create a mock process with empty PID
-        mock_process = Mock(spec=SdlProcess)
-        mock_process.pid.return_value = ""
-
-        with pytest.raises(ValidationError, match="Process has invalid PID"):
+        with pytest.raises(ValidationError, match=_RE_INVALID_PID):
             sdl_system.register(mock_process)
 
     # =====================================================================
@@ -87,27 +132,26 @@ class TestSdlSystemErrorPaths:
         Covers line 101: Invalid PID in unregister.
         """
         # Create a mock process with empty PID
-        mock_process = Mock(spec=SdlProcess)
-        mock_process.pid.return_value = ""
+        mock_process = _StubProcess("")
 
-        with pytest.raises(ValidationError, match="Process has invalid PID"):
+        with pytest.raises(ValidationError, match=_RE_INVALID_PID):
             sdl_system.unregister(mock_process)
 
-    def test_unregister_process_not_in_proc_map_logs_warning(self, sdl_system) -> None:
+    def test_unregister_process_not_in_proc_map_logs_warning(
+        self, sdl_system, mock_warning
+    ) -> None:
         """Test unregistering process not in proc_map logs warning.
 
         Covers line 108: Warning when process not in proc_map.
         """
         # Create a valid process but don't register it
-        mock_process = Mock(spec=SdlProcess)
-        mock_process.pid.return_value = "TestProcess(0.0)"
+        mock_process = _StubProcess("TestProcess(0.0)")
 
-        with patch("pysdl.system.SdlLogger.warning") as mock_warning:
-            result = sdl_system.unregister(mock_process)
+        result = sdl_system.unregister(mock_process)
 
-            assert result is True
-            mock_warning.assert_called()
-            assert "was not in proc_map" in str(mock_warning.call_args)
+        assert result is True
+        mock_warning.assert_called()
+        assert "was not in proc_map" in mock_warning.call_args.args[0]
 
     # =====================================================================
     # enqueue() Error Paths
@@ -121,7 +165,7 @@ class TestSdlSystemErrorPaths:
 
         Covers line 139: None signal validation.
         """
-        with pytest.raises(ValidationError, match="Cannot enqueue None"):
+        with pytest.raises(ValidationError, match=_RE_ENQUEUE_NONE):
             await sdl_system.enqueue(None)  # type: ignore
 
     @pytest.mark.asyncio
@@ -136,46 +180,27 @@ class TestSdlSystemErrorPaths:
 
         # Mock the queue to raise an exception
         with patch.object(sdl_system, "_get_queue") as mock_get_queue:
-            mock_queue = AsyncMock()
-            mock_queue.put.side_effect = RuntimeError("Queue is full")
-            mock_get_queue.return_value = mock_queue
+            mock_get_queue.return_value = _RaisingQueue(RuntimeError("Queue is full"))
 
-            with pytest.raises(QueueError, match="Failed to enqueue signal"):
+            with pytest.raises(QueueError, match=_RE_ENQUEUE_FAILED):
                 await sdl_system.enqueue(signal)
 
     # =====================================================================
     # lookup_proc_map() Error Paths
     # =====================================================================
 
-    def test_lookup_proc_map_with_none_dst_raises_validation_error(
-        self, sdl_system
+    @pytest.mark.parametrize(
+        "bad_dst", [None, "", 123], ids=["none", "empty", "non_string"]
+    )
+    def test_lookup_proc_map_with_invalid_dst_raises_validation_error(
+        self, sdl_system, bad_dst
     ) -> None:
-        """Test lookup_proc_map with None dst raises ValidationError.
+        """Test lookup_proc_map with a None, empty or non-string dst raises.
 
         Covers line 160: Invalid destination validation.
         """
-        with pytest.raises(ValidationError, match="Invalid destination PID"):
-            sdl_system.lookup_proc_map(None)  # type: ignore
-
-    def test_lookup_proc_map_with_empty_dst_raises_validation_error(
-        self, sdl_system
-    ) -> None:
-        """Test lookup_proc_map with empty dst raises ValidationError.
-
-        Covers line 160: Invalid destination validation.
-        """
-        with pytest.raises(ValidationError, match="Invalid destination PID"):
-            sdl_system.lookup_proc_map("")
-
-    def test_lookup_proc_map_with_non_string_dst_raises_validation_error(
-        self, sdl_system
-    ) -> None:
-        """Test lookup_proc_map with non-string dst raises ValidationError.
-
-        Covers line 160: Invalid destination validation (type check).
-        """
-        with pytest.raises(ValidationError, match="Invalid destination PID"):
-            sdl_system.lookup_proc_map(123)  # type: ignore
+        with pytest.raises(ValidationError, match=_RE_INVALID_DST):
+            sdl_system.lookup_proc_map(bad_dst)
 
     # =====================================================================
     # output() Error Paths
@@ -192,7 +217,7 @@ class TestSdlSystemErrorPaths:
         signal = SdlSignal.create()
         signal.set_dst("")  # Empty destination
 
-        with pytest.raises(ValidationError, match="Signal has no destination"):
+        with pytest.raises(ValidationError, match=_RE_NO_DESTINATION):
             await sdl_system.output(signal)
 
     @pytest.mark.asyncio
@@ -204,9 +229,9 @@ class TestSdlSystemErrorPaths:
         Covers lines 194-196: Signal delivery failure handling.
         """
         # Create a mock process that will fail on input
-        mock_process = Mock(spec=SdlProcess)
-        mock_process.pid.return_value = "TestProcess(0.0)"
-        mock_process.input = AsyncMock(side_effect=RuntimeError("Process crashed"))
+        mock_process = _StubProcess(
+            "TestProcess(0.0)", input_error=RuntimeError("Process crashed")
+        )
 
         # Register the mock process
         sdl_system.proc_map["TestProcess(0.0)"] = mock_process
@@ -214,24 +239,20 @@ class TestSdlSystemErrorPaths:
         signal = SdlSignal.create()
         signal.set_dst("TestProcess(0.0)")
 
-        with pytest.raises(
-            SignalDeliveryError, match="Failed to deliver signal to process"
-        ):
+        with pytest.raises(SignalDeliveryError, match=_RE_DELIVERY_FAILED):
             await sdl_system.output(signal)
 
     @pytest.mark.asyncio
     async def test_output_to_nonexistent_with_error_signal_delivery_failure(
-        self, sdl_system
+        self, sdl_system, mock_warning
     ) -> None:
         """Test output to nonexistent process when error signal delivery fails.
 
         Covers lines 218-219: Exception when sending error signal back to source.
         """
         # Create source process that will fail when receiving error signal
-        mock_source = Mock(spec=SdlProcess)
-        mock_source.pid.return_value = "Source(0.0)"
-        mock_source.input = AsyncMock(
-            side_effect=RuntimeError("Source process crashed")
+        mock_source = _StubProcess(
+            "Source(0.0)", input_error=RuntimeError("Source process crashed")
         )
 
         # Register source process
@@ -242,16 +263,14 @@ class TestSdlSystemErrorPaths:
         signal.set_src("Source(0.0)")
         signal.set_dst("NonExistent(0.0)")
 
-        with patch("pysdl.system.SdlLogger.warning") as mock_warning:
-            result = await sdl_system.output(signal)
+        result = await sdl_system.output(signal)
 
-            assert result is False
-            # Verify warning was logged for error signal delivery failure
-            warning_calls = [str(call) for call in mock_warning.call_args_list]
-            assert any(
-                "Failed to send error signal to source" in call
-                for call in warning_calls
-            )
+        assert result is False
+        # Verify warning was logged for error signal delivery failure
+        assert any(
+            "Failed to send error signal to source" in call.args[0]
+            for call in mock_warning.call_args_list
+        )
 
     # =====================================================================
     # startTimer() Error Paths
@@ -267,37 +286,50 @@ class TestSdlSystemErrorPaths:
         timer = SdlTimer.create()
         timer.set_src("")  # Empty source
 
-        with pytest.raises(TimerError, match="Timer has no source PID"):
+        with pytest.raises(TimerError, match=_RE_NO_SOURCE_PID):
             sdl_system.startTimer(timer)
 
-    def test_start_timer_handles_validation_error_from_stop_timer(
+    @pytest.mark.asyncio
+    async def test_start_timer_replaces_running_timer_with_same_key(
         self, sdl_system
     ) -> None:
-        """Test startTimer handles ValidationError from stopTimer gracefully.
+        """Test restarting a timer with the same ID and appcorr replaces it.
 
-        Covers lines 249-251: ValidationError handling in startTimer.
-        This path is executed when stopTimer raises ValidationError, which
-        is caught and ignored (timer not running is fine).
+        The replaced timer's deadline stays on the heap and is skipped when
+        it is popped.
         """
-        timer = SdlTimer.create()
-        timer.set_src("Process(0.0)")
-
-        # Mock stopTimer to raise ValidationError
-        with patch.object(
-            sdl_system, "stopTimer", side_effect=ValidationError("timer", "Test error")
-        ):
-            # This should not raise - ValidationError is caught
-            sdl_system.startTimer(timer)
+        old_timer = SdlTimer.create()
+        old_timer.set_src("Process(0.0)")
+        old_timer.set_dst("Process(0.0)")
+        old_timer.start(100)
+        sdl_system.startTimer(old_timer)
+
+        new_timer = SdlTimer.create()
+        new_timer.set_src("Process(0.0)")
+        new_timer.set_dst("Process(0.0)")
+        new_timer.start(500)
+        sdl_system.startTimer(new_timer)
+
+        bucket = sdl_system.timer_map["Process(0.0)"]
+        assert len(bucket) == 1
+        assert bucket.get(old_timer) is new_timer
+
+        with patch.object(sdl_system, "output") as mock_output:
+            # The old deadline is due but its entry no longer matches the bucket
+            await sdl_system.expire(200)
+            mock_output.assert_not_called()
+            assert bucket.get(new_timer) is new_timer
 
-            # Timer should be started despite ValidationError
-            assert "Process(0.0)" in sdl_system.timer_map
-            assert timer in sdl_system.timer_map["Process(0.0)"]
+            await sdl_system.expire(600)
+            mock_output.assert_called_once_with(new_timer)
 
     # =====================================================================
     # stopTimer() Error Paths
     # =====================================================================
 
-    def test_stop_timer_with_no_source_pid_logs_warning(self, sdl_system) -> None:
+    def test_stop_timer_with_no_source_pid_logs_warning(
+        self, sdl_system, mock_warning
+    ) -> None:
         """Test stopping timer with no source PID logs warning and returns False.
 
         Covers lines 277-278: Warning when timer has no source.
@@ -305,12 +337,11 @@ class TestSdlSystemErrorPaths:
         timer = SdlTimer.create()
         timer.set_src("")  # Empty source
 
-        with patch("pysdl.system.SdlLogger.warning") as mock_warning:
-            result = sdl_system.stopTimer(timer)
+        result = sdl_system.stopTimer(timer)
 
-            assert result is False
-            mock_warning.assert_called()
-            assert "has no source PID" in str(mock_warning.call_args)
+        assert result is False
+        mock_warning.assert_called()
+        assert "has no source PID" in mock_warning.call_args.args[0]
 
     # =====================================================================
     # get_next_signal() Error Paths
@@ -326,11 +357,9 @@ class TestSdlSystemErrorPaths:
         """
         # Mock the queue to raise an exception
         with patch.object(sdl_system, "_get_queue") as mock_get_queue:
-            mock_queue = AsyncMock()
-            mock_queue.get.side_effect = RuntimeError("Queue corrupted")
-            mock_get_queue.return_value = mock_queue
+            mock_get_queue.return_value = _RaisingQueue(RuntimeError("Queue corrupted"))
 
-            with pytest.raises(QueueError, match="Failed to get signal from queue"):
+            with pytest.raises(QueueError, match=_RE_QUEUE_GET_FAILED):
                 await sdl_system.get_next_signal()
 
     # =====================================================================
@@ -339,7 +368,7 @@ class TestSdlSystemErrorPaths:
 
     @pytest.mark.asyncio
     async def test_process_signal_with_nonexistent_destination(
-        self, sdl_system
+        self, sdl_system, mock_warning
     ) -> None:
         """Test _process_signal when destination process doesn't exist.
 
@@ -348,22 +377,17 @@ class TestSdlSystemErrorPaths:
         signal = SdlSignal.create()
         signal.set_dst("NonExistent(0.0)")
 
-        with patch("pysdl.system.SdlLogger.warning") as mock_warning:
-            await sdl_system._process_signal(signal)
+        await sdl_system._process_signal(signal)
 
-            mock_warning.assert_called()
-            assert (
-                "destination process not found" in str(mock_warning.call_args).lower()
-            )
+        mock_warning.assert_called()
+        assert "destination process not found" in mock_warning.call_args.args[0].lower()
 
     @pytest.mark.asyncio
-    async def test_process_signal_with_no_handler(self, sdl_system) -> None:
+    async def test_process_signal_with_no_handler(self, sdl_system, process) -> None:
         """Test _process_signal when no handler exists for signal.
 
         Covers lines 324-327: Logging when no signal handler found.
         """
-        # Create and register a real process
-        process = TestProcess(None, system=sdl_system)
         sdl_system.register(process)
 
         # Create a signal type that has no handler
@@ -377,8 +401,9 @@ class TestSdlSystemErrorPaths:
             await sdl_system._process_signal(signal)
 
             # Should log "SdlSig-NA" for unhandled signal
-            signal_calls = [str(call) for call in mock_log_signal.call_args_list]
-            assert any("SdlSig-NA" in call for call in signal_calls)
+            assert any(
+                "SdlSig-NA" in call.args[0] for call in mock_log_signal.call_args_list
+            )
 
     # NOTE: Lines 329-333 (signal handler exception) are difficult to test
     # in isolation because they require the state machine to properly register
@@ -392,15 +417,17 @@ class TestSdlSystemErrorPaths:
     # =====================================================================
 
     @pytest.mark.asyncio
-    async def test_expire_timer_delivery_failure_logs_warning(self, sdl_system) -> None:
+    async def test_expire_timer_delivery_failure_logs_warning(
+        self, sdl_system, mock_warning
+    ) -> None:
         """Test expire logs warning when timer delivery fails.
 
         Covers lines 423-428: Exception handling when delivering expired timer.
         """
         # Create a process that will fail on timer delivery
-        mock_process = Mock(spec=SdlProcess)
-        mock_process.pid.return_value = "Process(0.0)"
-        mock_process.input = AsyncMock(side_effect=RuntimeError("Process crashed"))
+        mock_process = _StubProcess(
+            "Process(0.0)", input_error=RuntimeError("Process crashed")
+        )
 
         sdl_system.proc_map["Process(0.0)"] = mock_process
 
@@ -412,24 +439,22 @@ class TestSdlSystemErrorPaths:
 
         sdl_system.startTimer(timer)
 
-        with patch("pysdl.system.SdlLogger.warning") as mock_warning:
-            # Expire at 200ms - timer should expire
-            await sdl_system.expire(200)
+        # Expire at 200ms - timer should expire
+        await sdl_system.expire(200)
 
-            # Warning should be logged
-            mock_warning.assert_called()
-            warning_calls = [str(call) for call in mock_warning.call_args_list]
-            assert any(
-                "failed to deliver expired timer" in call.lower()
-                for call in warning_calls
-            )
+        # Warning should be logged
+        mock_warning.assert_called()
+        assert any(
+            "failed to deliver expired timer" in call.args[0].lower()
+            for call in mock_warning.call_args_list
+        )
 
-            # Timer should still be removed despite delivery failure
-            assert "Process(0.0)" not in sdl_system.timer_map
+        # Timer should still be removed despite delivery failure
+        assert "Process(0.0)" not in sdl_system.timer_map
 
     @pytest.mark.asyncio
     async def test_expire_timer_expiration_check_exception_logs_warning(
-        self, sdl_system
+        self, sdl_system, mock_warning
     ) -> None:
         """Test expire logs warning when timer.expire() raises exception.
 
@@ -438,24 +463,24 @@ class TestSdlSystemErrorPaths:
         # Create a mock timer that fails on expire check
         mock_timer = Mock(spec=SdlTimer)
         mock_timer.src.return_value = "Process(0.0)"
+        mock_timer.deadline.return_value = 100
         mock_timer.expire.side_effect = RuntimeError("Timer corrupted")
 
-        # Add timer directly to timer_map
-        sdl_system.timer_map["Process(0.0)"] = [mock_timer]
+        sdl_system.startTimer(mock_timer)
 
-        with patch("pysdl.system.SdlLogger.warning") as mock_warning:
-            # Should not raise - exception is caught
-            await sdl_system.expire(200)
+        # Should not raise - exception is caught
+        await sdl_system.expire(200)
 
-            mock_warning.assert_called()
-            warning_calls = [str(call) for call in mock_warning.call_args_list]
-            assert any(
-                "error checking timer expiration" in call.lower()
-                for call in warning_calls
-            )
+        mock_warning.assert_called()
+        assert any(
+            "error checking timer expiration" in call.args[0].lower()
+            for call in mock_warning.call_args_list
+        )
 
     @pytest.mark.asyncio
-    async def test_expire_stop_timer_failure_logs_warning(self, sdl_system) -> None:
+    async def test_expire_stop_timer_failure_logs_warning(
+        self, sdl_system, process, mock_warning
+    ) -> None:
         """Test expire logs warning when stopTimer raises exception.
 
         Covers lines 438-440: Exception handling when removing expired timer.
@@ -468,27 +493,25 @@ class TestSdlSystemErrorPaths:
 
         sdl_system.startTimer(timer)
 
-        # Create process to allow delivery
-        process = TestProcess(None, system=sdl_system)
+        # Make the process available for delivery
         sdl_system.proc_map["Process(0.0)"] = process
 
         # Mock stopTimer to raise exception
-        with (
-            patch.object(
-                sdl_system, "stopTimer", side_effect=RuntimeError("Cannot stop timer")
-            ),
-            patch("pysdl.system.SdlLogger.warning") as mock_warning,
+        with patch.object(
+            sdl_system, "stopTimer", side_effect=RuntimeError("Cannot stop timer")
         ):
             await sdl_system.expire(200)
 
             # Warning should be logged for stopTimer failure
-            warning_calls = [str(call) for call in mock_warning.call_args_list]
             assert any(
-                "error removing expired timer" in call.lower() for call in warning_calls
+                "error removing expired timer" in call.args[0].lower()
+                for call in mock_warning.call_args_list
             )
 
     @pytest.mark.asyncio
-    async def test_expire_already_stopped_timer_logs_warning(self, sdl_system) -> None:
+    async def test_expire_already_stopped_timer_logs_warning(
+        self, sdl_system, process, mock_warning
+    ) -> None:
         """Test expire logs warning when timer was already stopped.
 
         Covers line 438: Warning when stopTimer returns False.
@@ -501,17 +524,15 @@ class TestSdlSystemErrorPaths:
 
         sdl_system.startTimer(timer)
 
-        # Create process to allow delivery
-        process = TestProcess(None, system=sdl_system)
+        # Make the process available for delivery
         sdl_system.proc_map["Process(0.0)"] = process
 
         # Mock stopTimer to return False (already stopped)
         with patch.object(sdl_system, "stopTimer", return_value=False):
-            with patch("pysdl.system.SdlLogger.warning") as mock_warning:
-                await sdl_system.expire(200)
-
-                # Warning should be logged
-                warning_calls = [str(call) for call in mock_warning.call_args_list]
-                assert any(
-                    "was already stopped" in call.lower() for call in warning_calls
-                )
+            await sdl_system.expire(200)
+
+            # Warning should be logged
+            assert any(
+                "was already stopped" in call.args[0].lower()
+                for call in mock_warning.call_args_list
+            )
@@ -10,6 +10,8 @@ Coverage focus:
 - SdlStarSignal.__str__() (lines 132-134)
 """
 
+import pytest
+
 from pysdl.system_signals import (
     SdlProcessNotExistSignal,
     SdlStarSignal,
@@ -19,18 +21,43 @@ from pysdl.system_signals import (
 )
 
 
+@pytest.fixture(scope="class")
+def signal(request):
+    """Provide one signal of the parametrized class, shared by a test class.
+
+    The tests that use it only read the signal, so it is created once per
+    class rather than once per test.
+    """
+    return request.param.create()
+
+
+@pytest.fixture(scope="class")
+def full_signal():
+    """Provide a SdlProcessNotExistSignal with every field set, shared per class."""
+    return SdlProcessNotExistSignal(
+        original_signal="CustomSignal",
+        destination="Target(5.0)",
+        source="Origin(3.0)",
+    )
+
+
+@pytest.fixture(scope="class")
+def empty_signal():
+    """Provide a SdlProcessNotExistSignal built with defaults, shared per class."""
+    return SdlProcessNotExistSignal()
+
+
+@pytest.mark.parametrize("signal", [SdlStartSignal], indirect=True, scope="class")
 class TestSdlStartSignal:
     """Test SdlStartSignal class."""
 
-    def test_start_signal_creation(self):
+    def test_start_signal_creation(self, signal):
         """Test creating a SdlStartSignal instance."""
-        signal = SdlStartSignal.create()
         assert signal is not None
         assert isinstance(signal, SdlStartSignal)
 
-    def test_start_signal_str_format(self):
+    def test_start_signal_str_format(self, signal):
         """Test __str__ method returns formatted string with brackets."""
-        signal = SdlStartSignal.create()
         result = str(signal)
 
         # Should be wrapped in brackets: [SdlStartSignal(...)]
@@ -38,27 +65,25 @@ class TestSdlStartSignal:
         assert result.endswith("]")
         assert "SdlStartSignal" in result
 
-    def test_start_signal_str_contains_base_representation(self):
+    def test_start_signal_str_contains_base_representation(self, signal):
         """Test __str__ includes base class representation."""
-        signal = SdlStartSignal.create()
         result = str(signal)
 
         # Should contain signal type name
         assert "SdlStartSignal" in result
 
 
+@pytest.mark.parametrize("signal", [SdlStoppingSignal], indirect=True, scope="class")
 class TestSdlStoppingSignal:
     """Test SdlStoppingSignal class."""
 
-    def test_stopping_signal_creation(self):
+    def test_stopping_signal_creation(self, signal):
         """Test creating a SdlStoppingSignal instance."""
-        signal = SdlStoppingSignal.create()
         assert signal is not None
         assert isinstance(signal, SdlStoppingSignal)
 
-    def test_stopping_signal_str_format(self):
+    def test_stopping_signal_str_format(self, signal):
         """Test __str__ method returns formatted string with brackets."""
-        signal = SdlStoppingSignal.create()
         result = str(signal)
 
         # Should be wrapped in brackets: [SdlStoppingSignal(...)]
@@ -66,27 +91,25 @@ class TestSdlStoppingSignal:
         assert result.endswith("]")
         assert "SdlStoppingSignal" in result
 
-    def test_stopping_signal_str_contains_base_representation(self):
+    def test_stopping_signal_str_contains_base_representation(self, signal):
         """Test __str__ includes base class representation."""
-        signal = SdlStoppingSignal.create()
         result = str(signal)
 
         # Should contain signal type name
         assert "SdlStoppingSignal" in result
 
 
+@pytest.mark.parametrize("signal", [SdlStopSignal], indirect=True, scope="class")
 class TestSdlStopSignal:
     """Test SdlStopSignal class (reserved for future use)."""
 
-    def test_stop_signal_creation(self):
+    def test_stop_signal_creation(self, signal):
         """Test creating a SdlStopSignal instance."""
-        signal = SdlStopSignal.create()
         assert signal is not None
         assert isinstance(signal, SdlStopSignal)
 
-    def test_stop_signal_str_format(self):
+    def test_stop_signal_str_format(self, signal):
         """Test __str__ method returns formatted string with brackets."""
-        signal = SdlStopSignal.create()
         result = str(signal)
 
         # Should be wrapped in brackets: [SdlStopSignal(...)]
@@ -94,27 +117,25 @@ class TestSdlStopSignal:
         assert result.endswith("]")
         assert "SdlStopSignal" in result
 
-    def test_stop_signal_str_contains_base_representation(self):
+    def test_stop_signal_str_contains_base_representation(self, signal):
         """Test __str__ includes base class representation."""
-        signal = SdlStopSignal.create()
         result = str(signal)
 
         # Should contain signal type name
         assert "SdlStopSignal" in result
 
 
+@pytest.mark.parametrize("signal", [SdlStarSignal], indirect=True, scope="class")
 class TestSdlStarSignal:
     """Test SdlStarSignal class for wildcard signal handling."""
 
-    def test_star_signal_creation(self):
+    def test_star_signal_creation(self, signal):
         """Test creating a SdlStarSignal instance."""
-        signal = SdlStarSignal.create()
         assert signal is not None
         assert isinstance(signal, SdlStarSignal)
 
-    def test_star_signal_str_format(self):
+    def test_star_signal_str_format(self, signal):
         """Test __str__ method returns formatted string with brackets."""
-        signal = SdlStarSignal.create()
         result = str(signal)
 
         # Should be wrapped in brackets: [SdlStarSignal(...)]
@@ -122,9 +143,8 @@ class TestSdlStarSignal:
         assert result.endswith("]")
         assert "SdlStarSignal" in result
 
-    def test_star_signal_str_contains_base_representation(self):
+    def test_star_signal_str_contains_base_representation(self, signal):
         """Test __str__ includes base class representation."""
-        signal = SdlStarSignal.create()
         result = str(signal)
 
         # Should contain signal type name
@@ -150,23 +170,15 @@ class TestSdlProcessNotExistSignal:
         assert signal.get_data("destination") == "Process(1.0)"
         assert signal.get_data("source") == "Sender(2.0)"
 
-    def test_process_not_exist_signal_creation_empty(self):
+    def test_process_not_exist_signal_creation_empty(self, empty_signal):
         """Test creating signal with default empty parameters."""
-        signal = SdlProcessNotExistSignal()
+        assert empty_signal.get_data("original_signal") == ""
+        assert empty_signal.get_data("destination") == ""
+        assert empty_signal.get_data("source") == ""
 
-        assert signal.get_data("original_signal") == ""
-        assert signal.get_data("destination") == ""
-        assert signal.get_data("source") == ""
-
-    def test_process_not_exist_signal_str_format(self):
+    def test_process_not_exist_signal_str_format(self, full_signal):
         """Test __str__ method includes all relevant information."""
-        signal = SdlProcessNotExistSignal(
-            original_signal="CustomSignal",
-            destination="Target(5.0)",
-            source="Origin(3.0)",
-        )
-
-        result = str(signal)
+        result = str(full_signal)
 
         # Should be wrapped in brackets
         assert result.startswith("[")
@@ -176,10 +188,9 @@ class TestSdlProcessNotExistSignal:
         assert "dest=Target(5.0)" in result
         assert "signal=CustomSignal" in result
 
-    def test_process_not_exist_signal_str_with_empty_data(self):
+    def test_process_not_exist_signal_str_with_empty_data(self, empty_signal):
         """Test __str__ with empty string data values."""
-        signal = SdlProcessNotExistSignal()
-        result = str(signal)
+        result = str(empty_signal)
 
         # Default empty strings are stored, so should show empty values
         # (get() with default "unknown" only applies if key is missing)
@@ -230,21 +241,22 @@ class TestSystemSignalsComparison:
         assert type(start_sig) is not type(star_sig)
         assert type(start_sig) is not type(not_exist_sig)
 
-    def test_str_methods_are_all_implemented(self):
-        """Test that all signal classes have working __str__ methods."""
-        signals = [
-            SdlStartSignal.create(),
-            SdlStoppingSignal.create(),
-            SdlStopSignal.create(),
-            SdlStarSignal.create(),
-            SdlProcessNotExistSignal(),
-        ]
-
-        for signal in signals:
-            result = str(signal)
-            # All should return non-empty strings
-            assert result
-            assert len(result) > 0
-            # All should be wrapped in brackets
-            assert result.startswith("[")
-            assert result.endswith("]")
+    @pytest.mark.parametrize(
+        "factory",
+        [
+            SdlStartSignal.create,
+            SdlStoppingSignal.create,
+            SdlStopSignal.create,
+            SdlStarSignal.create,
+            SdlProcessNotExistSignal,
+        ],
+        ids=["start", "stopping", "stop", "star", "process_not_exist"],
+    )
+    def test_str_methods_are_all_implemented(self, factory):
+        """Test that every signal class has a working __str__ method."""
+        result = str(factory())
+
+        # Should be a non-empty string wrapped in brackets
+        assert result
+        assert result.startswith("[")
+        assert result.endswith("]")
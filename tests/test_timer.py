@@ -3,63 +3,97 @@
 This module tests timer creation, expiry calculation, timer cancellation, and multiple timers.
 """
 
-from typing import Optional
+import operator
+from collections.abc import Callable
 
 import pytest
 
 from pysdl.id_generator import SdlIdGenerator
+from pysdl.signal import SdlSignal
 from pysdl.timer import SdlTimer
 
+# Payloads only read by the tests, so they are built once for the module
+_TEST_DATA = {"timeout_type": "shutdown"}
+_NON_TIMER_VALUES = (42, "string", None, [1, 2, 3], {"key": "value"})
+
+
+@pytest.fixture(scope="module")
+def module_timer() -> SdlTimer:
+    """Provide one unstarted timer for tests that only read from it."""
+    return SdlTimer.create()
+
+
+@pytest.fixture
+def make_timer_class() -> Callable[[], type[SdlTimer]]:
+    """Provide a factory for fresh SdlTimer subclasses, each with its own ID."""
+    created: list[type[SdlTimer]] = []
+
+    def make() -> type[SdlTimer]:
+        cls = type(f"Timer{len(created) + 1}", (SdlTimer,), {})
+        created.append(cls)
+        return cls
+
+    return make
+
 
 class TestSdlTimer:
     """Test cases for SdlTimer class."""
 
-    @pytest.fixture(autouse=True)
-    def reset_state(self) -> None:
-        """Reset state before each test."""
-        SdlIdGenerator._id = 0
+    @pytest.fixture
+    def reset_ids(self) -> None:
+        """Restart ID allocation for tests that compare timer IDs."""
+        SdlIdGenerator.reset()
+        SdlTimer._reset_all_ids()
 
-    def test_timer_creation(self) -> None:
+    def test_timer_creation(self, module_timer: SdlTimer) -> None:
         """Test basic timer creation."""
-        timer = SdlTimer.create()
-        assert timer is not None
-        assert isinstance(timer, SdlTimer)
+        assert module_timer is not None
+        assert isinstance(module_timer, SdlTimer)
 
     def test_timer_inherits_from_signal(self) -> None:
         """Test that timer inherits from SdlSignal."""
-        from pysdl.signal import SdlSignal
+        assert issubclass(SdlTimer, SdlSignal)
 
-        timer = SdlTimer.create()
-        assert isinstance(timer, SdlSignal)
-
-    def test_timer_id_assignment(self) -> None:
+    def test_timer_id_assignment(
+        self, reset_ids: None, make_timer_class: Callable[[], type[SdlTimer]]
+    ) -> None:
         """Test that timers get unique IDs."""
-
-        class Timer1(SdlTimer):
-            _id: Optional[int] = None
-
-        class Timer2(SdlTimer):
-            _id: Optional[int] = None
-
-        timer1 = Timer1.create()
-        timer2 = Timer2.create()
+        timer1 = make_timer_class().create()
+        timer2 = make_timer_class().create()
 
         # Different timer types should have different IDs
         assert timer1.id() != timer2.id()
 
-    def test_timer_initial_values(self) -> None:
+    def test_timer_initial_values(self, module_timer: SdlTimer) -> None:
         """Test timer initial values."""
-        timer = SdlTimer.create()
-        assert timer.appcorr() == 0
-        assert timer._duration == 0
-        assert timer._expiry == 0
-        assert timer.data is None
+        assert module_timer.appcorr() == 0
+        assert module_timer._duration == 0
+        assert module_timer._expiry == 0
+        assert module_timer.data is None
 
     def test_timer_with_data(self) -> None:
         """Test timer creation with data."""
-        test_data = {"timeout_type": "shutdown"}
-        timer = SdlTimer.create(test_data)
-        assert timer.data == test_data
+        timer = SdlTimer.create(_TEST_DATA)
+        assert timer.data == _TEST_DATA
+
+    def test_timer_release_recycles_poolable_timer(self) -> None:
+        """Test that a released poolable timer is reused with a fresh state."""
+
+        class PooledTimer(SdlTimer):
+            _poolable = True
+
+        timer = PooledTimer.create("first")
+        timer.set_appcorr(7)
+        timer.start(1000)
+        timer.expire(2000)
+        timer.release()
+
+        reused = PooledTimer.create("second")
+        assert reused is timer
+        assert reused.data == "second"
+        assert reused.appcorr() == 0
+        assert reused.deadline() == 0
+        assert not PooledTimer._pool
 
     def test_timer_set_appcorr(self) -> None:
         """Test setting timer application correlator."""
@@ -74,26 +108,31 @@ class TestSdlTimer:
         assert timer._duration == 5000
         assert timer._expiry == 0
 
-    def test_timer_expired_before_time(self) -> None:
-        """Test timer not expired before expiry time."""
-        timer = SdlTimer.create()
-        timer.start(5000)  # Duration: 5000ms
-        timer.expire(3000)  # Current time: 3000ms
-        assert timer.expired() is False
-
-    def test_timer_expired_at_expiry_time(self) -> None:
-        """Test timer expired at exactly expiry time."""
-        timer = SdlTimer.create()
-        timer.start(5000)  # Duration: 5000ms
-        timer.expire(5000)  # Current time: 5000ms
-        assert timer.expired() is True
-
-    def test_timer_expired_after_expiry_time(self) -> None:
-        """Test timer expired after expiry time."""
-        timer = SdlTimer.create()
-        timer.start(5000)  # Duration: 5000ms
-        timer.expire(6000)  # Current time: 6000ms
-        assert timer.expired() is True
+    @pytest.mark.parametrize(
+        ("duration", "now", "expected"),
+        [
+            (5000, 3000, False),
+            (5000, 5000, True),
+            (5000, 6000, True),
+            (0, 0, True),
+            (10**9, 5 * 10**8, False),
+            (10**9, 10**9, True),
+        ],
+        ids=[
+            "before_expiry",
+            "at_expiry",
+            "after_expiry",
+            "zero_duration",
+            "large_before_expiry",
+            "large_at_expiry",
+        ],
+    )
+    def test_timer_expired(self, duration: int, now: int, expected: bool) -> None:
+        """Test expired() against the expiry time for a started timer."""
+        timer = SdlTimer.create()
+        timer.start(duration)
+        timer.expire(now)
+        assert timer.expired() is expected
 
     def test_timer_not_expired_initially(self) -> None:
         """Test timer is not expired after being started but before time passes."""
@@ -130,103 +169,52 @@ class TestSdlTimer:
         assert timer.src() == "Process(0.0)"
         assert timer.dst() == "Process(0.0)"
 
-    def test_timer_equality_same_id_same_appcorr(self) -> None:
-        """Test timer equality with same ID and appcorr."""
-
-        class TestTimer(SdlTimer):
-            pass
-
-        timer1 = TestTimer.create()
-        timer2 = TestTimer.create()
+    @pytest.mark.parametrize(
+        ("appcorr", "op", "expected"),
+        [
+            (10, operator.eq, True),
+            (10, operator.ne, False),
+            (10, operator.le, True),
+            (10, operator.ge, True),
+            (20, operator.ne, True),
+        ],
+        ids=["equal", "not_equal", "less_equal", "greater_equal", "different_appcorr"],
+    )
+    def test_timer_comparison_same_id(
+        self,
+        make_timer_class: Callable[[], type[SdlTimer]],
+        appcorr: int,
+        op: Callable[[SdlTimer, SdlTimer], bool],
+        expected: bool,
+    ) -> None:
+        """Test comparing timers of one class, which share an ID, by appcorr."""
+        timer_class = make_timer_class()
+        timer1 = timer_class.create()
+        timer2 = timer_class.create()
         timer1.set_appcorr(10)
-        timer2.set_appcorr(10)
-
-        assert timer1 == timer2
-
-    def test_timer_inequality_different_id(self) -> None:
-        """Test timer inequality with different IDs."""
-
-        class Timer1(SdlTimer):
-            _id: Optional[int] = None
-
-        class Timer2(SdlTimer):
-            _id: Optional[int] = None
-
-        timer1 = Timer1.create()
-        timer2 = Timer2.create()
-
-        assert timer1 != timer2
-
-    def test_timer_inequality_different_appcorr(self) -> None:
-        """Test timer inequality with different appcorr."""
-
-        class TestTimer(SdlTimer):
-            pass
-
-        timer1 = TestTimer.create()
-        timer2 = TestTimer.create()
-        timer1.set_appcorr(10)
-        timer2.set_appcorr(20)
-
-        # Note: Based on the _compare implementation, different appcorr
-        # should make them not equal
-        assert timer1 != timer2
-
-    def test_timer_less_than_by_id(self) -> None:
-        """Test timer comparison by ID."""
-
-        class Timer1(SdlTimer):
-            _id: Optional[int] = None
-
-        class Timer2(SdlTimer):
-            _id: Optional[int] = None
-
-        timer1 = Timer1.create()
-        timer2 = Timer2.create()
-
-        # Timer1 should have lower ID (created first)
-        assert timer1 < timer2
-
-    def test_timer_greater_than_by_id(self) -> None:
-        """Test timer greater than comparison by ID."""
-
-        class Timer1(SdlTimer):
-            _id: Optional[int] = None
-
-        class Timer2(SdlTimer):
-            _id: Optional[int] = None
-
-        timer1 = Timer1.create()
-        timer2 = Timer2.create()
-
-        # Timer2 should have higher ID (created second)
-        assert timer2 > timer1
-
-    def test_timer_less_than_equal(self) -> None:
-        """Test timer less than or equal comparison."""
-
-        class TestTimer(SdlTimer):
-            pass
-
-        timer1 = TestTimer.create()
-        timer2 = TestTimer.create()
-        timer1.set_appcorr(10)
-        timer2.set_appcorr(10)
-
-        assert timer1 <= timer2
-
-    def test_timer_greater_than_equal(self) -> None:
-        """Test timer greater than or equal comparison."""
-
-        class TestTimer(SdlTimer):
-            pass
-
-        timer1 = TestTimer.create()
-        timer2 = TestTimer.create()
-        timer1.set_appcorr(10)
-        timer2.set_appcorr(10)
-
-        assert timer1 >= timer2
+        timer2.set_appcorr(appcorr)
+
+        assert op(timer1, timer2) is expected
+
+    @pytest.mark.parametrize(
+        "op",
+        [operator.eq, operator.ne, operator.lt, operator.le, operator.gt, operator.ge],
+        ids=lambda op: op.__name__,
+    )
+    def test_timer_comparison_by_id(
+        self,
+        reset_ids: None,
+        make_timer_class: Callable[[], type[SdlTimer]],
+        op: Callable[[object, object], bool],
+    ) -> None:
+        """Test timers of different classes compare the way their class IDs do."""
+        # The first class created gets the lower ID
+        timer1 = make_timer_class().create()
+        timer2 = make_timer_class().create()
+        assert timer1.id() < timer2.id()
+
+        assert op(timer1, timer2) is op(timer1.id(), timer2.id())
+        assert op(timer2, timer1) is op(timer2.id(), timer1.id())
 
     def test_timer_restart(self) -> None:
         """Test restarting a timer resets expiry."""
@@ -254,41 +242,13 @@ class TestSdlTimer:
         assert timer1.expired() is True
         assert timer2.expired() is False
 
-    def test_timer_with_zero_duration(self) -> None:
-        """Test timer with zero duration expires immediately."""
-        timer = SdlTimer.create()
-        timer.start(0)
-        timer.expire(0)
-        assert timer.expired() is True
-
-    def test_timer_with_large_duration(self) -> None:
-        """Test timer with large duration."""
-        timer = SdlTimer.create()
-        large_duration = 1000000000  # Very large number
-        timer.start(large_duration)
-        timer.expire(500000000)
-        assert timer.expired() is False
-        timer.expire(large_duration)
-        assert timer.expired() is True
-
-    def test_timer_equality_with_non_timer_returns_not_implemented(self) -> None:
-        """Test timer equality comparison with non-SdlTimer types returns NotImplemented."""
-        timer = SdlTimer.create()
-
-        # Test with various non-SdlTimer types
-        assert timer.__eq__(42) is NotImplemented
-        assert timer.__eq__("string") is NotImplemented
-        assert timer.__eq__(None) is NotImplemented
-        assert timer.__eq__([1, 2, 3]) is NotImplemented
-        assert timer.__eq__({"key": "value"}) is NotImplemented
-
-    def test_timer_inequality_with_non_timer_returns_not_implemented(self) -> None:
-        """Test timer inequality comparison with non-SdlTimer types returns NotImplemented."""
-        timer = SdlTimer.create()
+    @pytest.mark.parametrize("op", ["__eq__", "__ne__"])
+    def test_timer_comparison_with_non_timer_returns_not_implemented(
+        self, module_timer: SdlTimer, op: str
+    ) -> None:
+        """Test timer (in)equality with non-SdlTimer types returns NotImplemented."""
+        compare = getattr(SdlTimer, op)
 
         # Test with various non-SdlTimer types
-        assert timer.__ne__(42) is NotImplemented
-        assert timer.__ne__("string") is NotImplemented
-        assert timer.__ne__(None) is NotImplemented
-        assert timer.__ne__([1, 2, 3]) is NotImplemented
-        assert timer.__ne__({"key": "value"}) is NotImplemented
+        for other in _NON_TIMER_VALUES:
+            assert compare(module_timer, other) is NotImplemented